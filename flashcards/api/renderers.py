@@ -0,0 +1,56 @@
+"""Custom renderers for API endpoints.
+
+This module defines DRF renderers used to serialize API responses.
+"""
+
+import decimal
+from typing import Any
+
+import orjson
+from django.utils.functional import Promise
+from rest_framework.renderers import BaseRenderer
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Serialize types that orjson doesn't support natively.
+
+    orjson already handles datetime, date, time and UUID objects. This
+    covers the remaining types DRF responses may contain.
+
+    Raises:
+        TypeError: If the object type is not supported
+    """
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    if isinstance(obj, Promise):
+        # Lazy translation strings, e.g. in validation error messages
+        return str(obj)
+    msg = f"Type is not JSON serializable: {type(obj).__name__}"
+    raise TypeError(msg)
+
+
+class ORJSONRenderer(BaseRenderer):
+    """Renderer which serializes to JSON using orjson.
+
+    Drop-in replacement for DRF's JSONRenderer with considerably faster
+    encoding. Output is compact UTF-8 JSON, matching DRF's defaults
+    (COMPACT_JSON and UNICODE_JSON enabled).
+    """
+
+    media_type = "application/json"
+    format = "json"
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Render `data` into JSON, returning a bytestring."""
+        if data is None:
+            return b""
+
+        option = orjson.OPT_NON_STR_KEYS
+
+        # The browsable API requests indented output for display
+        renderer_context = renderer_context or {}
+        if renderer_context.get("indent"):
+            option |= orjson.OPT_INDENT_2
+
+        return orjson.dumps(data, default=_orjson_default, option=option)
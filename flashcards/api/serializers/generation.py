@@ -4,8 +4,21 @@ This module defines request and response serializers for the POST /api/generatio
 endpoint, including input validation and error response formatting.
 """
 
+from collections.abc import Mapping
+from typing import Any
+
 from rest_framework import serializers
 
+from flashcards.core.models import MAX_INPUT_TEXT_LENGTH
+
+INPUT_TEXT_ERROR_MESSAGES = {
+    "required": "This field is required.",
+    "null": "This field may not be null.",
+    "invalid": "Not a valid string.",
+    "blank": "This field may not be blank.",
+    "max_length": f"Ensure this field has no more than {MAX_INPUT_TEXT_LENGTH} characters.",
+}
+
 
 class GenerationRequestSerializer(serializers.Serializer):
     """Serializer for flashcard generation request.
@@ -15,24 +28,77 @@ class GenerationRequestSerializer(serializers.Serializer):
     - Trims leading/trailing whitespace
     - Must be non-empty after trimming
     - Maximum 10,000 characters
+
+    The endpoint validates requests with validate_generation_request(),
+    which applies the same rules without the serializer machinery. This
+    class documents the request contract.
     """
 
     input_text = serializers.CharField(
         required=True,
         allow_blank=False,
         trim_whitespace=True,
-        max_length=10000,
+        max_length=MAX_INPUT_TEXT_LENGTH,
         min_length=1,
         help_text="The text from which to generate flashcards (max 10,000 characters)",
         error_messages={
-            "required": "This field is required.",
-            "blank": "This field may not be blank.",
-            "max_length": "Ensure this field has no more than 10000 characters.",
-            "min_length": "This field may not be blank.",
+            **INPUT_TEXT_ERROR_MESSAGES,
+            "min_length": INPUT_TEXT_ERROR_MESSAGES["blank"],
         },
     )
 
 
+def validate_generation_request(data: Any) -> str:
+    """Validate a flashcard generation request body.
+
+    Hand-written equivalent of GenerationRequestSerializer for the hot
+    request path, producing the same error format.
+
+    Args:
+        data: Parsed request body (request.data)
+
+    Returns:
+        The input_text with leading/trailing whitespace trimmed
+
+    Raises:
+        ValidationError: If input_text is missing, not a string, blank or
+            too long
+    """
+    if not isinstance(data, Mapping):
+        raise serializers.ValidationError(
+            {
+                "non_field_errors": [
+                    f"Invalid data. Expected a dictionary, but got {type(data).__name__}.",
+                ],
+            },
+            code="invalid",
+        )
+
+    def error(code: str) -> serializers.ValidationError:
+        return serializers.ValidationError(
+            {"input_text": [INPUT_TEXT_ERROR_MESSAGES[code]]},
+            code=code,
+        )
+
+    if "input_text" not in data:
+        raise error("required")
+
+    input_text = data["input_text"]
+    if input_text is None:
+        raise error("null")
+    # Like serializers.CharField, accept numbers but reject other types
+    if isinstance(input_text, bool) or not isinstance(input_text, str | int | float):
+        raise error("invalid")
+
+    input_text = str(input_text).strip()
+    if not input_text:
+        raise error("blank")
+    if len(input_text) > MAX_INPUT_TEXT_LENGTH:
+        raise error("max_length")
+
+    return input_text
+
+
 class GeneratedFlashcardSerializer(serializers.Serializer):
     """Serializer for a single generated flashcard proposal.
 
@@ -55,6 +121,9 @@ class GenerationResponseSerializer(serializers.Serializer):
 
     Returns the generated flashcard proposals along with session metadata
     for analytics tracking.
+
+    Documents the response contract only - it isn't run at request time, as
+    the service output is already validated.
     """
 
     session_id = serializers.IntegerField(
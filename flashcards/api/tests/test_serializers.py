@@ -0,0 +1,51 @@
+"""Tests for API serializers and request validation."""
+
+import pytest
+from rest_framework.exceptions import ValidationError
+
+from flashcards.api.serializers.generation import GenerationRequestSerializer
+from flashcards.api.serializers.generation import validate_generation_request
+
+
+class TestValidateGenerationRequest:
+    """Tests for validate_generation_request()."""
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {},
+            {"input_text": None},
+            {"input_text": ""},
+            {"input_text": "   \n\t"},
+            {"input_text": "x" * 10001},
+            {"input_text": ["text"]},
+            {"input_text": True},
+            ["text"],
+        ],
+    )
+    def test_errors_match_serializer(self, data):
+        """Validation errors should match GenerationRequestSerializer's."""
+        serializer = GenerationRequestSerializer(data=data)
+        assert not serializer.is_valid()
+
+        with pytest.raises(ValidationError) as exc_info:
+            validate_generation_request(data)
+
+        assert exc_info.value.detail == serializer.errors
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"input_text": "  Some study material  "},
+            {"input_text": "x" * 10000},
+            {"input_text": 42},
+        ],
+    )
+    def test_valid_input_matches_serializer(self, data):
+        """Valid input should be returned trimmed, as the serializer does."""
+        serializer = GenerationRequestSerializer(data=data)
+        assert serializer.is_valid()
+
+        input_text = validate_generation_request(data)
+
+        assert input_text == serializer.validated_data["input_text"]
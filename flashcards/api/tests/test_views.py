@@ -0,0 +1,181 @@
+"""Tests for API views."""
+
+import orjson
+import pytest
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+
+from flashcards.api.views.generation import build_generation_response
+from flashcards.core.models import Flashcard
+from flashcards.core.services.flashcard_generation import FlashcardGenerationService
+from flashcards.core.services.flashcard_generation import GenerationResult
+from flashcards.users.tests.factories import UserFactory
+
+pytestmark = pytest.mark.django_db
+
+
+class TestFlashcardListView:
+    """Tests for the flashcard list API view."""
+
+    def test_creation_method_returned_by_name(self, client):
+        """Creation methods should be exposed by name, not stored code."""
+        user = UserFactory()
+        Flashcard.objects.create(
+            user=user,
+            front="Question",
+            back="Answer",
+            creation_method=Flashcard.MANUAL,
+        )
+
+        client.force_login(user)
+        response = client.get(reverse("core:api-flashcard-list"))
+
+        assert response.status_code == 200
+        [flashcard] = response.json()["results"]
+        assert flashcard["creation_method"] == "manual"
+        assert set(flashcard) == {
+            "id",
+            "front",
+            "back",
+            "creation_method",
+            "created_at",
+            "updated_at",
+        }
+
+    def test_cursor_pagination(self, client):
+        """Pages should be followed through cursor links without a count."""
+        user = UserFactory()
+        Flashcard.objects.bulk_create(
+            Flashcard(
+                user=user,
+                front=f"Question {index}",
+                back="Answer",
+                creation_method=Flashcard.MANUAL,
+            )
+            for index in range(30)
+        )
+
+        client.force_login(user)
+        first_page = client.get(reverse("core:api-flashcard-list")).json()
+        second_page = client.get(first_page["next"]).json()
+
+        assert "count" not in first_page
+        assert len(first_page["results"]) == 25  # noqa: PLR2004
+        assert len(second_page["results"]) == 5  # noqa: PLR2004
+        assert second_page["next"] is None
+        ids = [card["id"] for page in (first_page, second_page) for card in page["results"]]
+        assert len(set(ids)) == 30  # noqa: PLR2004
+
+
+class TestGenerateFlashcardsView:
+    """Tests for GenerateFlashcardsView."""
+
+    def test_success_response_wire_format(self, client, monkeypatch):
+        """Successful generation should return the documented JSON shape."""
+        result = GenerationResult(
+            session_id=789,
+            generated_count=2,
+            flashcards=[
+                {"front": "When did it begin?", "back": "In 1789."},
+                {"front": "Où?", "back": "À Paris."},
+            ],
+            success=True,
+            api_response_time_ms=5,
+        )
+        monkeypatch.setattr(
+            FlashcardGenerationService,
+            "generate_flashcards",
+            lambda self, command: result,
+        )
+
+        client.force_login(UserFactory())
+        url = reverse("core:api-generations")
+        response = client.post(
+            url,
+            {"input_text": "The French Revolution..."},
+            content_type="application/json",
+        )
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "application/json"
+        assert response.content == (
+            '{"session_id":789,"generated_count":2,"generated_flashcards":['
+            '{"front":"When did it begin?","back":"In 1789."},'
+            '{"front":"Où?","back":"À Paris."}]}'
+        ).encode()
+
+    def test_missing_input_text_returns_400(self, client):
+        """Requests without input_text should be rejected."""
+        client.force_login(UserFactory())
+        url = reverse("core:api-generations")
+        response = client.post(url, {}, content_type="application/json")
+
+        assert response.status_code == 400
+        assert response.json() == {"input_text": ["This field is required."]}
+
+    def test_malformed_json_returns_400(self, client):
+        """Request bodies that aren't valid JSON should be rejected."""
+        client.force_login(UserFactory())
+        url = reverse("core:api-generations")
+        response = client.post(url, "{", content_type="application/json")
+
+        assert response.status_code == 400
+        assert response.json()["detail"].startswith("JSON parse error")
+
+    def test_token_authentication(self, client, monkeypatch):
+        """Token-authenticated clients should be able to generate flashcards."""
+        result = GenerationResult(
+            session_id=789,
+            generated_count=0,
+            flashcards=[],
+            success=True,
+        )
+        monkeypatch.setattr(
+            FlashcardGenerationService,
+            "generate_flashcards",
+            lambda self, command: result,
+        )
+        token = Token.objects.create(user=UserFactory())
+
+        url = reverse("core:api-generations")
+        response = client.post(
+            url,
+            {"input_text": "Some text"},
+            content_type="application/json",
+            headers={"authorization": f"Token {token.key}"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["session_id"] == 789  # noqa: PLR2004
+
+    def test_unauthenticated_returns_403(self, client):
+        """Anonymous users should not be able to generate flashcards."""
+        url = reverse("core:api-generations")
+        response = client.post(
+            url,
+            {"input_text": "Some text"},
+            content_type="application/json",
+        )
+
+        assert response.status_code == 403
+
+    def test_get_not_allowed(self, client):
+        """Only POST requests should be accepted."""
+        client.force_login(UserFactory())
+        url = reverse("core:api-generations")
+        response = client.get(url)
+
+        assert response.status_code == 405
+
+
+def test_build_generation_response_matches_orjson():
+    """The precomputed envelope should match orjson's encoding of the dict."""
+    flashcards = [{"front": 'Say "hi"\n', "back": "Zdrowie 🍺"}]
+
+    assert build_generation_response(12, 1, flashcards) == orjson.dumps(
+        {
+            "session_id": 12,
+            "generated_count": 1,
+            "generated_flashcards": flashcards,
+        },
+    )
@@ -25,23 +25,23 @@ class FlashcardListView(generics.ListAPIView):
     **Sorting:** Supports ordering by created_at and updated_at fields.
     Default sort is -created_at (newest first).
 
-    **Pagination:** Uses FlashcardPagination (25-50 items per page, default 25).
+    **Pagination:** Uses cursor-based FlashcardPagination (25-50 items per
+    page, default 25). Follow the "next" and "previous" links to page.
 
     **Query Parameters:**
-    - page (int): Page number for pagination, default: 1
+    - cursor (str): Opaque pagination cursor from a "next"/"previous" link
     - page_size (int): Items per page, default: 25, range: 25-50
     - sort (str): Field to sort by, default: "-created_at",
                   allowed: "created_at", "-created_at", "updated_at", "-updated_at"
 
     **Example Request:**
-    GET /api/flashcards?page=2&page_size=25&sort=-created_at
+    GET /api/flashcards?page_size=25&sort=-created_at
 
     **Example Response (200 OK):**
     ```json
     {
-      "count": 150,
-      "next": "http://localhost:8000/api/flashcards?page=3",
-      "previous": "http://localhost:8000/api/flashcards?page=1",
+      "next": "http://localhost:8000/api/flashcards?cursor=cD0yMDI1LTAx...",
+      "previous": null,
       "results": [
         {
           "id": 456,
@@ -72,6 +72,9 @@ class FlashcardListView(generics.ListAPIView):
         accessing other users' flashcards.
 
         Uses the custom FlashcardManager.for_user() method which applies
-        efficient database-level filtering.
+        efficient database-level filtering. Only the columns the serializer
+        outputs are loaded.
         """
-        return Flashcard.objects.for_user(self.request.user)
+        return Flashcard.objects.for_user(self.request.user).only(
+            *FlashcardSerializer.model_fields,
+        )
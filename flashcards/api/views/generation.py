@@ -6,25 +6,55 @@ flashcard proposals from user input text using AI.
 
 import logging
 
+import orjson
+from django.http import HttpResponse
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from flashcards.api.serializers.generation import GenerationRequestSerializer
-from flashcards.api.serializers.generation import GenerationResponseSerializer
+from flashcards.api.serializers.generation import validate_generation_request
 from flashcards.core.services.flashcard_generation import FlashcardGenerationService
 from flashcards.core.services.flashcard_generation import GenerateFlashcardsCommand
 
 logger = logging.getLogger(__name__)
 
+# Shared by all requests in the process, as DRF instantiates the view per
+# request (see FlashcardGenerationService)
+_SERVICE = FlashcardGenerationService()
+
+
+def build_generation_response(
+    session_id: int,
+    generated_count: int,
+    flashcards: list[dict[str, str]],
+) -> bytes:
+    """Serialize a successful generation response body.
+
+    The envelope has a fixed shape, so its keys are written as constant
+    byte segments and only the flashcards are encoded. Produces the same
+    output as orjson.dumps() on the equivalent dict.
+    """
+    return b"".join(
+        (
+            b'{"session_id":',
+            str(int(session_id)).encode(),
+            b',"generated_count":',
+            str(int(generated_count)).encode(),
+            b',"generated_flashcards":',
+            orjson.dumps(flashcards),
+            b"}",
+        ),
+    )
+
 
 class GenerateFlashcardsView(APIView):
     """API view for generating flashcard proposals from input text.
 
     **Endpoint:** POST /api/generations
 
-    **Authentication:** Session-based authentication with CSRF protection
+    **Authentication:** Session-based authentication with CSRF protection,
+    or token authentication
 
     **Permissions:** IsAuthenticated (user must be logged in)
 
@@ -52,23 +82,24 @@ class GenerateFlashcardsView(APIView):
 
     **Error Responses:**
     - 400 Bad Request: Validation errors (missing/invalid input_text)
-    - 401 Unauthorized: Not authenticated
-    - 403 Forbidden: CSRF token missing
+    - 403 Forbidden: Not authenticated or CSRF token missing
+    - 405 Method Not Allowed: Request method other than POST
     - 500 Internal Server Error: AI generation failure
     """
 
     permission_classes = [IsAuthenticated]
+    http_method_names = ["post"]
 
     def __init__(self, **kwargs):
-        """Initialize view with flashcard generation service."""
+        """Initialize view with the shared flashcard generation service."""
         super().__init__(**kwargs)
-        self.service = FlashcardGenerationService()
+        self.service = _SERVICE
 
     def post(self, request):
         """Handle POST request to generate flashcards.
 
         Flow:
-        1. Validate request body using GenerationRequestSerializer
+        1. Validate request body using validate_generation_request()
         2. Create GenerateFlashcardsCommand with user and input_text
         3. Call FlashcardGenerationService.generate_flashcards()
         4. Return 200 OK with generated flashcards on success
@@ -81,11 +112,7 @@ class GenerateFlashcardsView(APIView):
             Response object with appropriate status code and data
         """
         # Validate request body
-        serializer = GenerationRequestSerializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-
-        # Extract validated data
-        input_text = serializer.validated_data["input_text"]
+        input_text = validate_generation_request(request.data)
 
         # Create command object for service layer
         command = GenerateFlashcardsCommand(
@@ -109,15 +136,14 @@ class GenerateFlashcardsView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
-        # Prepare response data
-        response_data = {
-            "session_id": result.session_id,
-            "generated_count": result.generated_count,
-            "generated_flashcards": result.flashcards,
-        }
-
-        # Serialize and return successful response
-        response_serializer = GenerationResponseSerializer(data=response_data)
-        response_serializer.is_valid(raise_exception=True)
-
-        return Response(response_serializer.data, status=status.HTTP_200_OK)
+        # Service output is already validated, so it's returned as-is. The shape
+        # is documented by GenerationResponseSerializer. The envelope is
+        # pre-encoded, so it bypasses the renderer.
+        return HttpResponse(
+            build_generation_response(
+                result.session_id,
+                result.generated_count,
+                result.flashcards,
+            ),
+            content_type="application/json",
+        )
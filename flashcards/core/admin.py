@@ -4,15 +4,83 @@ Provides comprehensive admin interface for debugging and data management
 with enhanced list displays, filters, and inline editing capabilities.
 """
 
+from typing import cast
+
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
+from django.db.models import Case
+from django.db.models import Model
+from django.db.models import Value
+from django.db.models import When
+from django.db.models.functions import Concat
+from django.db.models.functions import Length
+from django.db.models.functions import Substr
+from django.db.models.lookups import GreaterThan
+from django.urls import reverse
 from django.utils.html import format_html
 
+from .models import PREVIEW_LENGTH
 from .models import AIGenerationSession
 from .models import Flashcard
+from .pagination import invalidate_flashcard_list
+
+
+def _preview(obj: Model, name: str) -> str:
+    """Return the preview annotation `name` loaded by TextPreviewChangeList."""
+    return getattr(obj, name)
+
+
+def _truncated_preview(field: str) -> Case:
+    """Return an expression truncating `field` like truncate_text() does.
+
+    Only the first PREVIEW_LENGTH + 1 characters are read, which is enough
+    to tell whether the text needs truncating.
+    """
+    head = Substr(field, 1, PREVIEW_LENGTH + 1)
+    return Case(
+        When(
+            GreaterThan(Length(head), PREVIEW_LENGTH),
+            then=Concat(Substr(field, 1, PREVIEW_LENGTH - 3), Value("...")),
+        ),
+        default=head,
+    )
+
+
+class TextPreviewChangeList(ChangeList):
+    """ChangeList that loads short text previews instead of full text columns.
+
+    The model admin's `preview_fields` maps annotation names to the text
+    fields they preview. Previews are truncated by the database and the
+    full columns are deferred, along with any `list_deferred_fields`.
+    """
+
+    def get_queryset(self, request, exclude_parameters=None):
+        queryset = super().get_queryset(request, exclude_parameters)
+        model_admin = cast("TextPreviewModelAdmin", self.model_admin)
+        preview_fields = model_admin.preview_fields
+        annotations = {
+            name: _truncated_preview(field) for name, field in preview_fields.items()
+        }
+        return queryset.annotate(**annotations).defer(
+            *preview_fields.values(),
+            *model_admin.list_deferred_fields,
+        )
+
+
+class TextPreviewModelAdmin(admin.ModelAdmin):
+    """ModelAdmin whose changelist avoids loading large text columns."""
+
+    # Annotation name -> text field previewed on the changelist
+    preview_fields: dict[str, str] = {}
+    # Fields not displayed on the changelist, so not worth loading
+    list_deferred_fields: tuple[str, ...] = ()
+
+    def get_changelist(self, request, **kwargs):
+        return TextPreviewChangeList
 
 
 @admin.register(Flashcard)
-class FlashcardAdmin(admin.ModelAdmin):
+class FlashcardAdmin(TextPreviewModelAdmin):
     """Admin configuration for Flashcard model with debugging features."""
 
     list_display = (
@@ -75,22 +143,31 @@ class FlashcardAdmin(admin.ModelAdmin):
     date_hierarchy = "created_at"
     ordering = ("-created_at",)
     list_per_page = 50
+    # Avoid per-row queries for user_email. ai_session_link only needs
+    # ai_session_id, so the session (and its input_text) isn't joined.
+    list_select_related = ("user",)
+    preview_fields = {"front_short": "front", "back_short": "back"}
+
+    # Deletions don't send post_save, so drop the owners' cached lists here
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        invalidate_flashcard_list(obj.user_id)
+
+    def delete_queryset(self, request, queryset):
+        user_ids = set(queryset.values_list("user_id", flat=True))
+        super().delete_queryset(request, queryset)
+        for user_id in user_ids:
+            invalidate_flashcard_list(user_id)
 
     @admin.display(description="Front")
     def front_preview(self, obj: Flashcard) -> str:
         """Display truncated front text."""
-        max_length = 50
-        if len(obj.front) > max_length:
-            return f"{obj.front[:max_length]}..."
-        return obj.front
+        return _preview(obj, "front_short")
 
     @admin.display(description="Back")
     def back_preview(self, obj: Flashcard) -> str:
         """Display truncated back text."""
-        max_length = 50
-        if len(obj.back) > max_length:
-            return f"{obj.back[:max_length]}..."
-        return obj.back
+        return _preview(obj, "back_short")
 
     @admin.display(description="User", ordering="user__email")
     def user_email(self, obj: Flashcard) -> str:
@@ -100,14 +177,17 @@ class FlashcardAdmin(admin.ModelAdmin):
     @admin.display(description="AI Session")
     def ai_session_link(self, obj: Flashcard) -> str:
         """Display link to associated AI session if exists."""
-        if obj.ai_session:
-            url = f"/admin/core/aigenerationsession/{obj.ai_session.id}/change/"
-            return format_html('<a href="{}">Session #{}</a>', url, obj.ai_session.id)
+        if obj.ai_session_id:
+            url = reverse(
+                "admin:core_aigenerationsession_change",
+                args=[obj.ai_session_id],
+            )
+            return format_html('<a href="{}">Session #{}</a>', url, obj.ai_session_id)
         return "-"
 
 
 @admin.register(AIGenerationSession)
-class AIGenerationSessionAdmin(admin.ModelAdmin):
+class AIGenerationSessionAdmin(TextPreviewModelAdmin):
     """Admin configuration for AIGenerationSession with inline generated flashcards."""
 
     list_display = (
@@ -126,7 +206,7 @@ class AIGenerationSessionAdmin(admin.ModelAdmin):
         "input_text",
         "error_message",
     )
-    readonly_fields = ("created_at",)
+    readonly_fields = ("created_at", "accepted_count", "reviewed_count")
     fieldsets = (
         (
             "Session Info",
@@ -165,6 +245,8 @@ class AIGenerationSessionAdmin(admin.ModelAdmin):
                 "fields": (
                     "model",
                     "generated_count",
+                    "accepted_count",
+                    "reviewed_count",
                 ),
             },
         ),
@@ -172,6 +254,10 @@ class AIGenerationSessionAdmin(admin.ModelAdmin):
     date_hierarchy = "created_at"
     ordering = ("-created_at",)
     list_per_page = 50
+    # Avoid per-row queries for user_email
+    list_select_related = ("user",)
+    preview_fields = {"input_short": "input_text"}
+    list_deferred_fields = ("error_message",)
 
     @admin.display(description="User", ordering="user__email")
     def user_email(self, obj: AIGenerationSession) -> str:
@@ -181,7 +267,4 @@ class AIGenerationSessionAdmin(admin.ModelAdmin):
     @admin.display(description="Input Text")
     def input_preview(self, obj: AIGenerationSession) -> str:
         """Display truncated input text."""
-        max_length = 50
-        if len(obj.input_text) > max_length:
-            return f"{obj.input_text[:max_length]}..."
-        return obj.input_text
+        return _preview(obj, "input_short")
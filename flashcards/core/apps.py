@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "flashcards.core"
+
+    def ready(self):
+        import flashcards.core.signals  # noqa: F401, PLC0415
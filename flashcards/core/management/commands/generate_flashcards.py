@@ -6,10 +6,12 @@ from typing import TYPE_CHECKING
 from django.contrib.auth import get_user_model
 from django.core.management.base import BaseCommand
 from django.core.management.base import CommandError
+from django.db import transaction
 from faker import Faker
 
 from flashcards.core.models import AIGenerationSession
 from flashcards.core.models import Flashcard
+from flashcards.core.pagination import invalidate_flashcard_list
 from flashcards.core.services.flashcard_generation import FlashcardGenerationService
 from flashcards.core.services.flashcard_generation import GenerateFlashcardsCommand
 
@@ -18,6 +20,28 @@ if TYPE_CHECKING:
 else:
     User = get_user_model()
 
+# Number of flashcards inserted per INSERT statement
+BULK_CREATE_BATCH_SIZE = 1000
+
+# Shared across invocations, as loading Faker's providers is comparatively slow
+_FAKE = Faker("en_US")
+
+# Flashcard creation methods by their --creation-method identifier
+CREATION_METHODS_BY_SLUG = {
+    slug: method for method, slug in Flashcard.CREATION_METHOD_SLUGS.items()
+}
+
+# Question builders keyed by flashcard category type
+_FRONT_BUILDERS = {
+    "vocabulary": lambda fake: "What does '" + fake.word() + "' mean?",
+    "definition": lambda fake: "Define: " + fake.word().capitalize(),
+    "historical": lambda fake: "When did " + fake.catch_phrase() + " occur?",
+    "scientific": lambda fake: "What is " + fake.bs() + "?",
+    "mathematical": lambda fake: "How do you calculate " + fake.word() + "?",
+    "geography": lambda fake: "What is the capital of " + fake.country() + "?",
+    "language": lambda fake: "Translate '" + fake.sentence(nb_words=4) + "' to English",
+}
+
 
 class Command(BaseCommand):
     """Generate fake flashcards for development and testing purposes."""
@@ -48,6 +72,11 @@ class Command(BaseCommand):
             type=str,
             help="Input text for AI generation (required when using --creation-method=ai_full)",
         )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            help="Seed for reproducible flashcard content (default: random)",
+        )
 
     def handle(self, *args, **options):
         """Execute the command."""
@@ -88,33 +117,48 @@ class Command(BaseCommand):
         if creation_method == "ai_full":
             self._handle_ai_full_generation(user, input_text, count)
 
-        # Initialize Faker
-        fake = Faker()
+        # Reseed the shared Faker instance, from system randomness unless a
+        # seed was given
+        seed = options.get("seed")
+        fake = _FAKE
+        fake.seed_instance(seed)
 
         # Define categories and question types for more realistic flashcards
         categories = self._get_flashcard_categories()
 
-        # Generate flashcards
-        flashcards_created = []
-        for _ in range(count):
-            category = random.choice(categories)
+        # Pick categories and creation methods for all flashcards up front
+        # rather than once per iteration
+        rng = random.Random(seed)
+        chosen_categories = rng.choices(categories, k=count)
+        if creation_method == "mixed":
+            chosen_methods = rng.choices(
+                [Flashcard.AI_FULL, Flashcard.AI_EDITED, Flashcard.MANUAL],
+                k=count,
+            )
+        else:
+            method = CREATION_METHODS_BY_SLUG[creation_method]
+            chosen_methods = [method] * count
+
+        # Build flashcards in memory, then insert them in batches
+        flashcards = []
+        for category, method in zip(chosen_categories, chosen_methods, strict=True):
             front, back = self._generate_flashcard_content(fake, category)
 
-            # Determine creation method
-            if creation_method == "mixed":
-                method = random.choice(
-                    [Flashcard.AI_FULL, Flashcard.AI_EDITED, Flashcard.MANUAL],
-                )
-            else:
-                method = creation_method
-
-            flashcard = Flashcard.objects.create(
-                user=user,
-                front=front,
-                back=back,
-                creation_method=method,
+            flashcards.append(
+                Flashcard(
+                    user=user,
+                    front=front,
+                    back=back,
+                    creation_method=method,
+                ),
+            )
+
+        with transaction.atomic():
+            flashcards_created = Flashcard.objects.bulk_create(
+                flashcards,
+                batch_size=BULK_CREATE_BATCH_SIZE,
             )
-            flashcards_created.append(flashcard)
+        invalidate_flashcard_list(user.pk)
 
         self.stdout.write(
             self.style.SUCCESS(
@@ -123,80 +167,50 @@ class Command(BaseCommand):
         )
 
     def _get_flashcard_categories(self):
-        """Return list of flashcard categories with question/answer patterns."""
+        """Return list of flashcard categories with answer patterns.
+
+        The question for each category is built by the matching entry in
+        ``_FRONT_BUILDERS``, keyed by the category "type".
+        """
         return [
             {
                 "type": "vocabulary",
-                "question_format": "What does '{word}' mean?",
                 "answer_generator": lambda fake: fake.sentence(nb_words=8),
             },
             {
                 "type": "definition",
-                "question_format": "Define: {term}",
                 "answer_generator": lambda fake: fake.sentence(nb_words=12),
             },
             {
                 "type": "historical",
-                "question_format": "When did {event} occur?",
                 "answer_generator": lambda fake: f"In {fake.year()}, {fake.sentence(nb_words=10)}",
             },
             {
                 "type": "scientific",
-                "question_format": "What is {concept}?",
                 "answer_generator": lambda fake: fake.sentence(nb_words=15),
             },
             {
                 "type": "mathematical",
-                "question_format": "How do you calculate {formula}?",
                 "answer_generator": lambda fake: fake.sentence(nb_words=20),
             },
             {
                 "type": "geography",
-                "question_format": "What is the capital of {location}?",
                 "answer_generator": lambda fake: fake.city(),
             },
             {
                 "type": "language",
-                "question_format": "Translate '{phrase}' to English",
                 "answer_generator": lambda fake: fake.sentence(nb_words=6),
             },
         ]
 
     def _generate_flashcard_content(self, fake, category):
         """Generate front and back content for a flashcard based on category."""
-        question_format = category["question_format"]
-        answer_generator = category["answer_generator"]
-
-        # Generate placeholder values for question format
-        if "{word}" in question_format:
-            word = fake.word()
-            front = question_format.format(word=word)
-        elif "{term}" in question_format:
-            term = fake.word().capitalize()
-            front = question_format.format(term=term)
-        elif "{event}" in question_format:
-            event = fake.catch_phrase()
-            front = question_format.format(event=event)
-        elif "{concept}" in question_format:
-            concept = fake.bs()
-            front = question_format.format(concept=concept)
-        elif "{formula}" in question_format:
-            formula = fake.word()
-            front = question_format.format(formula=formula)
-        elif "{location}" in question_format:
-            location = fake.country()
-            front = question_format.format(location=location)
-        elif "{phrase}" in question_format:
-            phrase = fake.sentence(nb_words=4)
-            front = question_format.format(phrase=phrase)
-        else:
-            front = question_format
-
-        # Ensure front doesn't exceed 200 characters
-        front = front[:200]
+        # Fronts are built from short Faker values (single words, phrases of
+        # a few words, country names), so they always fit in 200 characters
+        front = _FRONT_BUILDERS[category["type"]](fake)
 
         # Generate back content
-        back = answer_generator(fake)
+        back = category["answer_generator"](fake)
         # Ensure back doesn't exceed 500 characters
         back = back[:500]
 
@@ -244,16 +258,22 @@ class Command(BaseCommand):
             ai_session = AIGenerationSession.objects.get(id=result.session_id)
 
             # Create Flashcard records from generated flashcards
-            flashcards_created = []
-            for card_data in result.flashcards:
-                flashcard = Flashcard.objects.create(
+            flashcards = [
+                Flashcard(
                     user=user,
                     front=card_data["front"],
                     back=card_data["back"],
                     creation_method=Flashcard.AI_FULL,
                     ai_session=ai_session,
                 )
-                flashcards_created.append(flashcard)
+                for card_data in result.flashcards
+            ]
+            with transaction.atomic():
+                flashcards_created = Flashcard.objects.bulk_create(
+                    flashcards,
+                    batch_size=BULK_CREATE_BATCH_SIZE,
+                )
+            invalidate_flashcard_list(user.pk)
 
             self.stdout.write(
                 self.style.SUCCESS(
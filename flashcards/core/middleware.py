@@ -0,0 +1,39 @@
+"""Middleware for core flashcard views."""
+
+from django.http import HttpResponseBadRequest
+
+
+class RequestBodySizeMiddleware:
+    """Reject request bodies bigger than the view they're meant for accepts.
+
+    Views opt in with a ``max_request_body_size`` attribute (in bytes). The
+    check runs in process_view, so it must come before CsrfViewMiddleware,
+    which reads request.POST when validating the token. By then
+    AuthenticationMiddleware has set request.user, and anonymous requests
+    are left to the view, which redirects them to the login page.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        return self.get_response(request)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        """Return a 400 if the declared Content-Length is over the view's limit.
+
+        Returns:
+            HttpResponseBadRequest or None: None lets the request through
+        """
+        view_class = getattr(view_func, "view_class", None)
+        max_size = getattr(view_class, "max_request_body_size", None)
+        if max_size is None or not request.user.is_authenticated:
+            return None
+
+        try:
+            content_length = int(request.META.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            content_length = 0
+        if content_length > max_size:
+            return HttpResponseBadRequest("Request body too large.")
+        return None
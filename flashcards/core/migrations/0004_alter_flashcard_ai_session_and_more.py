@@ -0,0 +1,32 @@
+# Generated by Django 5.2.7 on 2026-10-14 04:35
+
+import django.db.models.deletion
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # Indexes are built concurrently to avoid locking the flashcards table
+    # against writes, which can't be done inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('core', '0003_flashcard_ai_review_state_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # The partial index is built before the full one is dropped, so
+        # session lookups stay indexed throughout
+        AddIndexConcurrently(
+            model_name='flashcard',
+            index=models.Index(condition=models.Q(('ai_session__isnull', False)), fields=['ai_session'], name='flashcard_ai_session_idx'),
+        ),
+        migrations.AlterField(
+            model_name='flashcard',
+            name='ai_session',
+            field=models.ForeignKey(blank=True, db_index=False, help_text='AI generation session that created this card (if applicable)', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='accepted_flashcards', to='core.aigenerationsession'),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.7 on 2026-10-14 04:43
+
+from django.conf import settings
+from django.db import migrations, models
+
+# Stored value of each creation method before and after this migration
+CREATION_METHODS = {
+    "ai_full": "0",
+    "ai_edited": "1",
+    "manual": "2",
+}
+
+
+def creation_method_to_int(apps, schema_editor):
+    """Replace creation method names with their integer codes."""
+    Flashcard = apps.get_model("core", "Flashcard")
+    for name, code in CREATION_METHODS.items():
+        Flashcard.objects.filter(creation_method=name).update(creation_method=code)
+
+
+def creation_method_to_name(apps, schema_editor):
+    """Replace integer creation method codes with their names."""
+    Flashcard = apps.get_model("core", "Flashcard")
+    for name, code in CREATION_METHODS.items():
+        Flashcard.objects.filter(creation_method=code).update(creation_method=name)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_alter_flashcard_ai_session_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(creation_method_to_int, creation_method_to_name),
+        migrations.AlterField(
+            model_name='flashcard',
+            name='creation_method',
+            field=models.PositiveSmallIntegerField(choices=[(0, 'AI Generated'), (1, 'AI Generated (Edited)'), (2, 'Manually Created')], help_text='How this flashcard was created'),
+        ),
+        migrations.AddIndex(
+            model_name='flashcard',
+            index=models.Index(fields=['user', 'creation_method'], name='flashcard_user_method_idx'),
+        ),
+    ]
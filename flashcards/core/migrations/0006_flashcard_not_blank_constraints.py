@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-10-14 04:47
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_flashcard_creation_method_smallint'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='flashcard',
+            constraint=models.CheckConstraint(condition=models.Q(('front__regex', '\\S')), name='flashcard_front_not_blank'),
+        ),
+        migrations.AddConstraint(
+            model_name='flashcard',
+            constraint=models.CheckConstraint(condition=models.Q(('back__regex', '\\S')), name='flashcard_back_not_blank'),
+        ),
+    ]
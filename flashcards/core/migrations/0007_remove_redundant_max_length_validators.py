@@ -0,0 +1,24 @@
+# Generated by Django 5.2.7 on 2026-10-14 04:48
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_flashcard_not_blank_constraints'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='flashcard',
+            name='back',
+            field=models.CharField(help_text='Answer or explanation text (max 500 characters)', max_length=500, validators=[django.core.validators.MinLengthValidator(1)]),
+        ),
+        migrations.AlterField(
+            model_name='flashcard',
+            name='front',
+            field=models.CharField(help_text='Question or prompt text (max 200 characters)', max_length=200, validators=[django.core.validators.MinLengthValidator(1)]),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.7 on 2026-10-14 04:50
+
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models import OuterRef
+from django.db.models import Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_review_counts(apps, schema_editor):
+    """Set review counters from the current state of each session's flashcards."""
+    AIGenerationSession = apps.get_model("core", "AIGenerationSession")
+    Flashcard = apps.get_model("core", "Flashcard")
+
+    def count_flashcards(review_states):
+        flashcards = (
+            Flashcard.objects.filter(
+                ai_session=OuterRef("pk"),
+                ai_review_state__in=review_states,
+            )
+            .order_by()
+            .values("ai_session")
+            .annotate(count=Count("pk"))
+            .values("count")
+        )
+        return Coalesce(Subquery(flashcards), 0)
+
+    AIGenerationSession.objects.update(
+        accepted_count=count_flashcards(["accepted"]),
+        reviewed_count=count_flashcards(["accepted", "rejected"]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_remove_redundant_max_length_validators'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='aigenerationsession',
+            name='accepted_count',
+            field=models.PositiveIntegerField(default=0, help_text='Number of generated flashcards accepted by the user'),
+        ),
+        migrations.AddField(
+            model_name='aigenerationsession',
+            name='reviewed_count',
+            field=models.PositiveIntegerField(default=0, help_text='Number of generated flashcards accepted or rejected by the user'),
+        ),
+        migrations.RunPython(backfill_review_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.7 on 2026-10-14 04:53
+
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # Indexes are built concurrently to avoid locking the flashcards table
+    # against writes, which can't be done inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('core', '0008_aigenerationsession_review_counts'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='flashcard',
+            index=models.Index(condition=models.Q(('ai_review_state', 'pending')), fields=['ai_session', 'id'], name='flashcard_pending_review_idx'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.7 on 2026-10-14 06:10
+
+import hashlib
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_input_text_hashes(apps, schema_editor):
+    """Hash the input text of existing sessions."""
+    AIGenerationSession = apps.get_model("core", "AIGenerationSession")
+
+    sessions = AIGenerationSession.objects.only("input_text").iterator(chunk_size=1000)
+    batch = []
+    for session in sessions:
+        session.input_text_hash = hashlib.sha256(session.input_text.encode()).hexdigest()
+        batch.append(session)
+        if len(batch) == 1000:
+            AIGenerationSession.objects.bulk_update(batch, ["input_text_hash"])
+            batch = []
+    AIGenerationSession.objects.bulk_update(batch, ["input_text_hash"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_flashcard_pending_review_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='aigenerationsession',
+            name='input_text_hash',
+            field=models.CharField(default='', editable=False, help_text='SHA-256 hex digest of the input text, for exact-match lookups', max_length=64),
+            preserve_default=False,
+        ),
+        migrations.RunPython(backfill_input_text_hashes, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='aigenerationsession',
+            index=models.Index(fields=['user', 'input_text_hash'], name='ai_session_user_input_idx'),
+        ),
+    ]
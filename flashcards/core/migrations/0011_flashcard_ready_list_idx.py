@@ -0,0 +1,24 @@
+# Generated by Django 5.2.7 on 2026-10-14 05:12
+
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # Indexes are built concurrently to avoid locking the flashcards table
+    # against writes, which can't be done inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('core', '0010_aigenerationsession_input_text_hash'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='flashcard',
+            index=models.Index(condition=models.Q(('creation_method', 2), ('ai_review_state', 'accepted'), _connector='OR'), fields=['user', '-created_at'], include=('id',), name='flashcard_ready_list_idx'),
+        ),
+    ]
@@ -5,16 +5,42 @@ This module defines the core data models for the flashcard application:
 - AIGenerationSession: AI generation attempt tracking for analytics
 """
 
+import hashlib
+
 from django.conf import settings
 from django.core.validators import MaxLengthValidator
 from django.core.validators import MinLengthValidator
 from django.db import models
 from django.db.models import Q
 
+# Default length of text previews used for admin display
+PREVIEW_LENGTH = 50
+
+# Longest study material accepted for AI flashcard generation
+MAX_INPUT_TEXT_LENGTH = 10000
+
+# Flashcard choice values used by the partial index conditions in
+# Flashcard.Meta, which can't see the class attributes. Use the Flashcard
+# attributes everywhere else.
+_MANUAL = 2
+_PENDING = "pending"
+_ACCEPTED = "accepted"
+
+# Ready flashcards: manually created ones, and AI generated ones accepted in
+# review. Shared by FlashcardQuerySet.ready() and the partial index for it.
+READY_FLASHCARDS = Q(creation_method=_MANUAL) | Q(ai_review_state=_ACCEPTED)
+
+
+def truncate_text(text: str, length: int = PREVIEW_LENGTH) -> str:
+    """Truncate text to `length` characters, ending with "..." if shortened."""
+    if len(text) <= length:
+        return text
+    return f"{text[: length - 3]}..."
+
 
 class FlashcardQuerySet(models.QuerySet):
     def ready(self):
-        return self.filter(Q(creation_method="manual") | Q(ai_review_state="accepted"))
+        return self.filter(READY_FLASHCARDS)
 
 
 class FlashcardManager(models.Manager):
@@ -39,10 +65,10 @@ class Flashcard(models.Model):
     tracking for success metrics calculation.
     """
 
-    # Creation method choices
-    AI_FULL = "ai_full"
-    AI_EDITED = "ai_edited"
-    MANUAL = "manual"
+    # Creation method choices, stored as small integers
+    AI_FULL = 0
+    AI_EDITED = 1
+    MANUAL = _MANUAL
 
     CREATION_METHOD_CHOICES = [
         (AI_FULL, "AI Generated"),
@@ -50,9 +76,16 @@ class Flashcard(models.Model):
         (MANUAL, "Manually Created"),
     ]
 
+    # Identifiers exposing creation methods in the API and CLI
+    CREATION_METHOD_SLUGS = {
+        AI_FULL: "ai_full",
+        AI_EDITED: "ai_edited",
+        MANUAL: "manual",
+    }
+
     # AI generated flashcard review state
-    PENDING = "pending"
-    ACCEPTED = "accepted"
+    PENDING = _PENDING
+    ACCEPTED = _ACCEPTED
     REJECTED = "rejected"
 
     AI_GENERATED_FLASHCARD_REVIEW_STATE = [
@@ -71,18 +104,17 @@ class Flashcard(models.Model):
 
     front = models.CharField(
         max_length=200,
-        validators=[MinLengthValidator(1), MaxLengthValidator(200)],
+        validators=[MinLengthValidator(1)],
         help_text="Question or prompt text (max 200 characters)",
     )
 
     back = models.CharField(
         max_length=500,
-        validators=[MinLengthValidator(1), MaxLengthValidator(500)],
+        validators=[MinLengthValidator(1)],
         help_text="Answer or explanation text (max 500 characters)",
     )
 
-    creation_method = models.CharField(
-        max_length=20,
+    creation_method = models.PositiveSmallIntegerField(
         choices=CREATION_METHOD_CHOICES,
         help_text="How this flashcard was created",
     )
@@ -93,6 +125,8 @@ class Flashcard(models.Model):
         null=True,
         blank=True,
         related_name="accepted_flashcards",
+        # Indexed by flashcard_ai_session_idx instead (partial, non-null rows only)
+        db_index=False,
         help_text="AI generation session that created this card (if applicable)",
     )
 
@@ -126,12 +160,54 @@ class Flashcard(models.Model):
                 fields=["user", "-created_at"],
                 name="flashcard_user_created_idx",
             ),
+            # Composite index for filtering a user's flashcards by creation method
+            models.Index(
+                fields=["user", "creation_method"],
+                name="flashcard_user_method_idx",
+            ),
+            # Partial index for session lookups; most flashcards have no session
+            models.Index(
+                fields=["ai_session"],
+                name="flashcard_ai_session_idx",
+                condition=Q(ai_session__isnull=False),
+            ),
+            # Partial index for a session's review queue; once reviewed,
+            # flashcards drop out of it
+            models.Index(
+                fields=["ai_session", "id"],
+                name="flashcard_pending_review_idx",
+                condition=Q(ai_review_state=_PENDING),
+            ),
+            # Partial index matching FlashcardQuerySet.ready() (manual, or
+            # accepted AI flashcards), for the newest-first flashcard list
+            models.Index(
+                fields=["user", "-created_at"],
+                include=["id"],
+                name="flashcard_ready_list_idx",
+                condition=READY_FLASHCARDS,
+            ),
+        ]
+        constraints = [
+            # Front and back must contain at least one non-whitespace character
+            models.CheckConstraint(
+                condition=Q(front__regex=r"\S"),
+                name="flashcard_front_not_blank",
+            ),
+            models.CheckConstraint(
+                condition=Q(back__regex=r"\S"),
+                name="flashcard_back_not_blank",
+            ),
         ]
 
     def __str__(self):
-        """Return front text truncated to 50 characters for admin display."""
-        front_preview = self.front[:47] + "..." if len(self.front) > 50 else self.front  # noqa: PLR2004
-        return f"{self.user.email}: {front_preview}"
+        """Return front text truncated to 50 characters for admin display.
+
+        Falls back to the primary key when front is deferred (e.g. on admin
+        changelists), so that rendering doesn't trigger a query per row.
+        """
+        if "front" in self.get_deferred_fields():
+            return f"{self.user.email}: Flashcard #{self.pk}"
+        return f"{self.user.email}: {truncate_text(self.front)}"
 
 
 class AIGenerationSession(models.Model):
@@ -153,10 +229,16 @@ class AIGenerationSession(models.Model):
     )
 
     input_text = models.TextField(
-        validators=[MaxLengthValidator(10000)],
+        validators=[MaxLengthValidator(MAX_INPUT_TEXT_LENGTH)],
         help_text="Input text provided by user (max 10,000 characters)",
     )
 
+    input_text_hash = models.CharField(
+        max_length=64,
+        editable=False,
+        help_text="SHA-256 hex digest of the input text, for exact-match lookups",
+    )
+
     generated_count = models.PositiveIntegerField(
         help_text="Number of flashcards generated",
     )
@@ -178,6 +260,17 @@ class AIGenerationSession(models.Model):
         help_text="API response time in milliseconds for performance monitoring",
     )
 
+    # Review counters, incremented as flashcards are accepted or rejected
+    accepted_count = models.PositiveIntegerField(
+        default=0,
+        help_text="Number of generated flashcards accepted by the user",
+    )
+
+    reviewed_count = models.PositiveIntegerField(
+        default=0,
+        help_text="Number of generated flashcards accepted or rejected by the user",
+    )
+
     created_at = models.DateTimeField(
         auto_now_add=True,
         help_text="Timestamp when session was created",
@@ -196,13 +289,34 @@ class AIGenerationSession(models.Model):
             ),
             # Single index for time-based analytics
             models.Index(fields=["created_at"], name="ai_session_created_idx"),
+            # Finding a user's earlier sessions for the same input text
+            models.Index(
+                fields=["user", "input_text_hash"],
+                name="ai_session_user_input_idx",
+            ),
         ]
 
     def __str__(self):
-        """Return session summary for admin display."""
-        input_preview = (
-            self.input_text[:47] + "..."
-            if len(self.input_text) > 50  # noqa: PLR2004
-            else self.input_text
-        )
-        return f"{self.user.email} - {input_preview}"
+        """Return session summary for admin display.
+
+        Falls back to the primary key when input_text is deferred (e.g. on
+        admin changelists), so that rendering doesn't trigger a query per row.
+        """
+        if "input_text" in self.get_deferred_fields():
+            return f"{self.user.email} - Session #{self.pk}"
+        return f"{self.user.email} - {truncate_text(self.input_text)}"
+
+    @staticmethod
+    def hash_input_text(input_text: str) -> str:
+        """Return the value stored in input_text_hash for the given text."""
+        return hashlib.sha256(input_text.encode()).hexdigest()
+
+    @property
+    def acceptance_rate(self) -> float | None:
+        """Return the percentage of reviewed flashcards that were accepted.
+
+        Returns None if no flashcards have been reviewed yet.
+        """
+        if not self.reviewed_count:
+            return None
+        return self.accepted_count / self.reviewed_count * 100
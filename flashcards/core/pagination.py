@@ -1,22 +1,96 @@
 """Custom pagination classes for the core flashcard app.
 
 This module defines DRF pagination classes that enforce business logic
-requirements for API endpoints.
+requirements for API endpoints, and Django paginators for the HTML views.
 """
 
-from rest_framework.pagination import PageNumberPagination
+import uuid
+from typing import Any
+from typing import cast
 
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import transaction
+from rest_framework.pagination import CursorPagination
 
-class FlashcardPagination(PageNumberPagination):
+# How long a user's list of flashcard IDs is cached, in seconds
+FLASHCARD_LIST_CACHE_TIMEOUT = 60
+
+
+def flashcard_list_cache_key(user_id: int) -> str:
+    """Return the cache key of the IDs of the user's ready flashcards."""
+    return f"flashcards:ready_ids:{user_id}"
+
+
+def invalidate_flashcard_list(user_id: int) -> None:
+    """Drop the cached flashcard IDs after the user's ready flashcards changed.
+
+    The key is deleted once the current transaction commits. Deleting it
+    earlier would let a concurrent list request cache the IDs as they were
+    before the change.
+    """
+    key = flashcard_list_cache_key(user_id)
+    transaction.on_commit(lambda: cache.delete(key))
+
+
+class CachedPKPaginator(Paginator):
+    """Paginator over a cached list of the objects' primary keys.
+
+    The primary keys of the whole list are fetched once and cached, so
+    later page loads take the count from the list and fetch only the page's
+    objects by primary key. Without it, every page load counts all rows and
+    makes the database skip the rows of all earlier pages (OFFSET).
+
+    The objects are expected as a values() queryset including the primary
+    key, so pages hold plain dicts rather than model instances.
+
+    Each cached list gets a random version, exposed as cache_version, which
+    changes whenever the list is fetched again (e.g. after invalidation).
+    Other data derived from the list can include it in their cache keys.
+    """
+
+    def __init__(self, object_list, per_page, *, cache_key: str, **kwargs):
+        self.queryset = object_list
+        # get_or_set() only returns None for a None default
+        self.cache_version, pks = cast(
+            "tuple[str, list[Any]]",
+            cache.get_or_set(
+                cache_key,
+                lambda: (
+                    uuid.uuid4().hex,
+                    list(object_list.values_list("pk", flat=True)),
+                ),
+                FLASHCARD_LIST_CACHE_TIMEOUT,
+            ),
+        )
+        super().__init__(pks, per_page, **kwargs)
+
+    def page(self, number):
+        """Return the page, with its primary keys replaced by the objects."""
+        page = super().page(number)
+        pk_name = self.queryset.model._meta.pk.attname  # noqa: SLF001
+        pks = page.object_list
+        rows = {row[pk_name]: row for row in self.queryset.filter(pk__in=pks)}
+        # Objects deleted since the list was cached are skipped
+        page.object_list = [rows[pk] for pk in pks if pk in rows]
+        return page
+
+
+class FlashcardPagination(CursorPagination):
     """Custom pagination for flashcard list endpoint.
 
     Enforces page_size range of 25-50 items as per PRD requirements.
     Default page size is 25 items.
+
+    Cursor-based, so pages are fetched with an index range scan instead of
+    requiring a COUNT(*) of all the user's flashcards, and remain stable
+    while flashcards are added or deleted.
     """
 
     page_size = 25
     page_size_query_param = "page_size"
     max_page_size = 50
+    ordering = "-created_at"
 
     def get_page_size(self, request):
         """Get and validate page_size parameter.
@@ -9,14 +9,32 @@ from rest_framework import serializers
 from flashcards.core.models import Flashcard
 
 
-class FlashcardSerializer(serializers.ModelSerializer):
-    """Serializer for Flashcard model exposing read-only fields for listing.
+class FlashcardSerializer(serializers.Serializer):
+    """Read-only serializer for listing flashcards.
 
     Used by the GET /api/flashcards endpoint to return paginated flashcard data.
-    All fields are read-only as this serializer is only used for listing flashcards.
+    A plain Serializer with explicit fields rather than a ModelSerializer, as
+    it is only used for output and doesn't need model field introspection.
     """
 
-    class Meta:
-        model = Flashcard
-        fields = ["id", "front", "back", "creation_method", "created_at", "updated_at"]
-        read_only_fields = ["id", "created_at", "updated_at"]
+    id = serializers.IntegerField(read_only=True)
+    front = serializers.CharField(read_only=True)
+    back = serializers.CharField(read_only=True)
+    # Exposed by name (e.g. "ai_full") rather than the stored integer code
+    creation_method = serializers.SerializerMethodField()
+    created_at = serializers.DateTimeField(read_only=True)
+    updated_at = serializers.DateTimeField(read_only=True)
+
+    # Model fields read by this serializer, for use with QuerySet.only()
+    model_fields = (
+        "id",
+        "front",
+        "back",
+        "creation_method",
+        "created_at",
+        "updated_at",
+    )
+
+    def get_creation_method(self, obj):
+        """Return the creation method identifier for the flashcard."""
+        return Flashcard.CREATION_METHOD_SLUGS[obj.creation_method]
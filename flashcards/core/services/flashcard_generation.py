@@ -4,26 +4,45 @@ This service handles the business logic for generating flashcards from user inpu
 using Google's Gemini API via the GeminiLLMService.
 """
 
+import functools
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
+from typing import Protocol
+from typing import TypeVar
 
 from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Count
+from django.db.models import F
+from django.db.models import Q
 from pydantic import BaseModel
+from pydantic import ConfigDict
 from pydantic import Field
 
 from flashcards.core.models import AIGenerationSession
 from flashcards.core.models import Flashcard
-from flashcards.core.services.llm_service import GeminiLLMService
 
 if TYPE_CHECKING:
+    from flashcards.core.services.llm_service import GeminiLLMService
     from flashcards.users.models import User
 else:
     User = get_user_model()
 
 logger = logging.getLogger(__name__)
 
+# Error reported to users when flashcard generation fails
+GENERATION_ERROR_CODE = "ai_generation_failed"
+GENERATION_ERROR_MESSAGE = "Couldn't generate flashcards right now. Please try again."
+
+# Number of rows inserted per INSERT statement when storing results
+BULK_CREATE_BATCH_SIZE = 1000
+
+# Maximum number of concurrent LLM requests made by bulk generation
+MAX_GENERATION_CONCURRENCY = 8
+
 # Validation constants for flashcard fields
 MAX_FRONT_LENGTH = 200
 MAX_BACK_LENGTH = 500
@@ -47,15 +66,60 @@ class GenerateFlashcardsError(Exception):
     pass
 
 
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
+
+
+class StructuredLLMService(Protocol):
+    """LLM service used by FlashcardGenerationService.
+
+    GeminiLLMService is the production implementation.
+    """
+
+    def generate_structured(
+        self,
+        prompt: str,
+        response_schema: type[SchemaT],
+    ) -> SchemaT: ...
+
+
+@functools.lru_cache(maxsize=8)
+def _get_llm_service(model_name: str) -> "GeminiLLMService":
+    """Return the shared flashcard generation LLM service for a model.
+
+    Services are created once per model and process, so the underlying
+    Gemini client and its HTTP connection pool are reused across requests.
+    The client is safe to share between threads.
+    """
+    # Imported on first use, as loading the Gemini SDK is slow and most
+    # processes importing this module (e.g. for migrations or the admin)
+    # never generate flashcards
+    from flashcards.core.services.llm_service import GeminiLLMService  # noqa: PLC0415
+
+    return GeminiLLMService(
+        model=model_name,
+        system_instruction=FLASHCARD_GENERATION_SYSTEM_INSTRUCTION,
+        temperature=0.7,
+        max_output_tokens=2048,
+    )
+
+
 class FlashcardSchema(BaseModel):
-    """Schema for a single flashcard returned by the LLM."""
+    """Schema for a single flashcard returned by the LLM.
+
+    Text is trimmed before the length constraints are checked, which also
+    rejects blank values.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid", str_strip_whitespace=True)
 
     front: str = Field(
         description="The question or prompt on the front of the flashcard",
+        min_length=1,
         max_length=MAX_FRONT_LENGTH,
     )
     back: str = Field(
         description="The answer or explanation on the back of the flashcard",
+        min_length=1,
         max_length=MAX_BACK_LENGTH,
     )
 
@@ -63,6 +127,8 @@ class FlashcardSchema(BaseModel):
 class FlashcardGenerationResponse(BaseModel):
     """Schema for the complete flashcard generation response from LLM."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     flashcards: list[FlashcardSchema] = Field(
         description="List of generated flashcards (5-10 cards)",
         min_length=5,
@@ -116,16 +182,19 @@ class FlashcardGenerationService:
     This service creates AIGenerationSession records for analytics tracking
     and returns generated flashcard proposals without persisting them to the
     Flashcard model (users accept/reject proposals in a separate flow).
+
+    The service lazily creates its LLM client on first use and is otherwise
+    stateless, so views share one instance across requests and threads
+    instead of creating one per request.
     """
 
-    def __init__(self, llm_service: GeminiLLMService | None = None) -> None:
+    def __init__(self, llm_service: StructuredLLMService | None = None) -> None:
         """Initialize the flashcard generation service.
 
         Args:
-            llm_service: Optional GeminiLLMService instance. If None, creates a new
-                instance with default settings.
+            llm_service: Optional LLM service, e.g. a GeminiLLMService. If
+                None, a shared instance for the requested model is used.
         """
-        self.logger = logger
         self._llm_service = llm_service
 
     def generate_flashcards(
@@ -135,11 +204,19 @@ class FlashcardGenerationService:
         """Generate flashcards from input text using AI.
 
         This is the main entry point for flashcard generation. It:
-        1. Creates an AIGenerationSession record for analytics
-        2. Calls the AI service (mocked for MVP)
-        3. Validates generated flashcards
-        4. Updates the session with results
-        5. Returns a GenerationResult object
+        1. Calls the AI service, whose response is validated by
+           FlashcardGenerationResponse
+           (unless the user's previous session for the same input text can
+           be reused, see _reuse_previous_generation())
+        2. Creates an AIGenerationSession record with the results for
+           analytics
+        3. Stores the generated flashcards pending review
+        4. Returns a GenerationResult object
+
+        The session is inserted once, with its final state, after the AI
+        call. Web requests run in a transaction (ATOMIC_REQUESTS), so
+        creating it upfront wouldn't leave a record of interrupted requests
+        anyway.
 
         Args:
             command: GenerateFlashcardsCommand containing user, input_text,
@@ -148,17 +225,224 @@ class FlashcardGenerationService:
         Returns:
             GenerationResult with success status, flashcards, and session_id
         """
-        # Create AIGenerationSession record for analytics tracking
-        session = AIGenerationSession.objects.create(
+        return self.generate_flashcards_bulk([command])[0]
+
+    def generate_flashcards_bulk(
+        self,
+        commands: list[GenerateFlashcardsCommand],
+    ) -> list[GenerationResult]:
+        """Generate flashcards for several requests at once.
+
+        Works like generate_flashcards() for each command, but the AI calls
+        for the commands run concurrently, and the sessions and flashcards of
+        all commands are stored with one bulk INSERT each, in a single
+        transaction.
+
+        Args:
+            commands: GenerateFlashcardsCommand objects to generate flashcards
+                for
+
+        Returns:
+            GenerationResult for each command, in the same order
+        """
+        reused = [self._reuse_previous_generation(command) for command in commands]
+        to_generate = [
+            command
+            for command, generation in zip(commands, reused, strict=True)
+            if generation is None
+        ]
+
+        # Commands with the same input text and model only need one AI call
+        unique_commands: dict[tuple[str, str], GenerateFlashcardsCommand] = {}
+        for command in to_generate:
+            unique_commands.setdefault(
+                (command.input_text, command.model_name),
+                command,
+            )
+
+        if len(unique_commands) > 1:
+            # AI calls are I/O bound and don't use the database, so they can
+            # run in worker threads
+            max_workers = min(MAX_GENERATION_CONCURRENCY, len(unique_commands))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                outcomes = list(executor.map(self._generate, unique_commands.values()))
+        else:
+            outcomes = [self._generate(command) for command in unique_commands.values()]
+        outcomes_by_key = dict(zip(unique_commands, outcomes, strict=True))
+
+        generated = []
+        for command in to_generate:
+            key = (command.input_text, command.model_name)
+            session, flashcards = outcomes_by_key[key]
+            if command is not unique_commands[key]:
+                session = self._copy_session(session, command.user)
+            generated.append((session, flashcards))
+
+        generated_iter = iter(generated)
+        generations = [generation or next(generated_iter) for generation in reused]
+
+        with transaction.atomic(savepoint=False):
+            AIGenerationSession.objects.bulk_create(
+                [session for session, _ in generations],
+                batch_size=BULK_CREATE_BATCH_SIZE,
+            )
+            Flashcard.objects.bulk_create(
+                [
+                    Flashcard(
+                        user=session.user,
+                        front=flashcard["front"],
+                        back=flashcard["back"],
+                        creation_method=Flashcard.AI_FULL,
+                        ai_session=session,
+                        ai_review_state=Flashcard.PENDING,
+                    )
+                    for session, flashcards in generations
+                    for flashcard in flashcards
+                ],
+                batch_size=BULK_CREATE_BATCH_SIZE,
+            )
+
+        log_successes = logger.isEnabledFor(logging.INFO)
+        results = []
+        for session, flashcards in generations:
+            if session.error_code:
+                results.append(
+                    GenerationResult(
+                        session_id=session.id,
+                        generated_count=0,
+                        flashcards=[],
+                        success=False,
+                        error_code=session.error_code,
+                        error_message=GENERATION_ERROR_MESSAGE,
+                    ),
+                )
+                continue
+
+            if log_successes:
+                logger.info(
+                    "Successfully generated %d flashcards for user %s",
+                    len(flashcards),
+                    session.user.id,
+                    extra={
+                        "user_id": session.user.id,
+                        "session_id": session.id,
+                        "generated_count": len(flashcards),
+                        "response_time_ms": session.api_response_time_ms,
+                    },
+                )
+            results.append(
+                GenerationResult(
+                    session_id=session.id,
+                    generated_count=len(flashcards),
+                    flashcards=flashcards,
+                    success=True,
+                    api_response_time_ms=session.api_response_time_ms,
+                ),
+            )
+
+        return results
+
+    def _reuse_previous_generation(
+        self,
+        command: GenerateFlashcardsCommand,
+    ) -> tuple[AIGenerationSession, list[dict[str, str]]] | None:
+        """Copy the flashcards of the user's last identical generation.
+
+        A previous successful session with the same input text and model is
+        only reused while all of its flashcards still exist unedited, so
+        that they are exactly what the AI generated.
+
+        Args:
+            command: GenerateFlashcardsCommand to find a previous session for
+
+        Returns:
+            Tuple of a new unsaved AIGenerationSession and the previous
+            session's flashcards, or None if there is nothing to reuse
+        """
+        input_text_hash = AIGenerationSession.hash_input_text(command.input_text)
+        previous_session = (
+            AIGenerationSession.objects.filter(
+                user=command.user,
+                input_text_hash=input_text_hash,
+                input_text=command.input_text,
+                model=command.model_name,
+                error_code="",
+                generated_count__gt=0,
+            )
+            .alias(
+                unedited_count=Count(
+                    "accepted_flashcards",
+                    filter=Q(accepted_flashcards__creation_method=Flashcard.AI_FULL),
+                ),
+            )
+            .filter(unedited_count=F("generated_count"))
+            .order_by("-created_at")
+            .only("pk")
+            .first()
+        )
+        if previous_session is None:
+            return None
+
+        rows = (
+            Flashcard.objects.filter(ai_session=previous_session)
+            .order_by("id")
+            .values_list("front", "back")
+        )
+        flashcards = [{"front": front, "back": back} for front, back in rows]
+        session = AIGenerationSession(
+            user=command.user,
+            input_text=command.input_text,
+            input_text_hash=input_text_hash,
+            model=command.model_name,
+            generated_count=len(flashcards),
+            api_response_time_ms=0,
+        )
+        return session, flashcards
+
+    def _copy_session(
+        self,
+        session: AIGenerationSession,
+        user: User,
+    ) -> AIGenerationSession:
+        """Return an unsaved copy of a generation outcome for another command."""
+        return AIGenerationSession(
+            user=user,
+            input_text=session.input_text,
+            input_text_hash=session.input_text_hash,
+            model=session.model,
+            generated_count=session.generated_count,
+            error_code=session.error_code,
+            error_message=session.error_message,
+            api_response_time_ms=session.api_response_time_ms,
+        )
+
+    def _generate(
+        self,
+        command: GenerateFlashcardsCommand,
+    ) -> tuple[AIGenerationSession, list[dict[str, str]]]:
+        """Call the AI service for a command, without storing anything.
+
+        Args:
+            command: GenerateFlashcardsCommand to generate flashcards for
+
+        Returns:
+            Tuple of the unsaved AIGenerationSession holding the outcome, and
+            the generated flashcards (empty if generation failed)
+        """
+        # AIGenerationSession record for analytics tracking, saved once the
+        # outcome is known
+        session = AIGenerationSession(
             user=command.user,
             input_text=command.input_text,
+            input_text_hash=AIGenerationSession.hash_input_text(command.input_text),
             model=command.model_name,
-            generated_count=0,  # Will be updated after generation
+            generated_count=0,
         )
 
         try:
-            # Track API response time
-            start_time = time.time()
+            # Track API response time with the highest-resolution monotonic clock,
+            # unaffected by system time adjustments
+            start_ns = time.perf_counter_ns()
 
             # Generate flashcards using Gemini LLM
             flashcards = self._generate_flashcards_with_llm(
@@ -167,78 +451,31 @@ class FlashcardGenerationService:
             )
 
             # Calculate response time
-            response_time_ms = int((time.time() - start_time) * 1000)
-
-            # Validate generated flashcards
-            valid_flashcards = self._validate_flashcards(flashcards, session.id)
-
-            # Store generated flashcards
-            for flashcard in valid_flashcards:
-                Flashcard.objects.create(
-                    user=command.user,
-                    front=flashcard["front"],
-                    back=flashcard["back"],
-                    creation_method=Flashcard.AI_FULL,
-                    ai_session=session,
-                    ai_review_state=Flashcard.PENDING,
-                )
-
-            # Update session with successful generation results
-            session.generated_count = len(valid_flashcards)
-            session.api_response_time_ms = response_time_ms
-            session.save(update_fields=["generated_count", "api_response_time_ms"])
-
-            self.logger.info(
-                "Successfully generated %d flashcards for user %s",
-                len(valid_flashcards),
-                command.user.id,
-                extra={
-                    "user_id": command.user.id,
-                    "session_id": session.id,
-                    "generated_count": len(valid_flashcards),
-                    "response_time_ms": response_time_ms,
-                },
-            )
-
-            return GenerationResult(
-                session_id=session.id,
-                generated_count=len(valid_flashcards),
-                flashcards=valid_flashcards,
-                success=True,
-                api_response_time_ms=response_time_ms,
-            )
+            response_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
         except Exception as e:
             # Log detailed error information for debugging
-            error_code = "ai_generation_failed"
-            error_message = "Couldn't generate flashcards right now. Please try again."
-
-            self.logger.exception(
+            logger.exception(
                 "AI generation failed for user %s: %s",
                 command.user.id,
-                error_code,
+                GENERATION_ERROR_CODE,
                 extra={
                     "user_id": command.user.id,
                     "input_text_preview": command.input_text[:100],
-                    "session_id": session.id,
-                    "error_code": error_code,
+                    "error_code": GENERATION_ERROR_CODE,
                     "exception": str(e),
                 },
             )
 
-            # Update session with error details for analytics
-            session.error_code = error_code
+            # Record error details on the session for analytics
+            session.error_code = GENERATION_ERROR_CODE
             session.error_message = str(e)
-            session.save(update_fields=["error_code", "error_message"])
-
-            return GenerationResult(
-                session_id=session.id,
-                generated_count=0,
-                flashcards=[],
-                success=False,
-                error_code=error_code,
-                error_message=error_message,
-            )
+            return session, []
+
+        # Record successful generation results on the session
+        session.generated_count = len(flashcards)
+        session.api_response_time_ms = response_time_ms
+        return session, flashcards
 
     def _generate_flashcards_with_llm(
         self,
@@ -257,14 +494,9 @@ class FlashcardGenerationService:
         Raises:
             GenerateFlashcardsError: If LLM generation fails
         """
-        # Initialize LLM service if not provided in constructor
-        if self._llm_service is None:
-            self._llm_service = GeminiLLMService(
-                model=model_name,
-                system_instruction=FLASHCARD_GENERATION_SYSTEM_INSTRUCTION,
-                temperature=0.7,
-                max_output_tokens=2048,
-            )
+        # Use the shared LLM service for the model unless one was provided in
+        # the constructor
+        llm_service = self._llm_service or _get_llm_service(model_name)
 
         # Create prompt for flashcard generation
         prompt = f"""Generate educational flashcards from the following text:
@@ -275,7 +507,7 @@ Create 5-10 flashcards that cover the most important concepts, facts, and ideas
 
         try:
             # Call LLM with structured output
-            response = self._llm_service.generate_structured(
+            response = llm_service.generate_structured(
                 prompt=prompt,
                 response_schema=FlashcardGenerationResponse,
             )
@@ -285,71 +517,14 @@ Create 5-10 flashcards that cover the most important concepts, facts, and ideas
                 {"front": card.front, "back": card.back} for card in response.flashcards
             ]
 
-            self.logger.info(
+            logger.info(
                 "LLM generated %d flashcards from input_text_length=%d",
                 len(flashcards),
                 len(input_text),
             )
         except Exception as e:
-            self.logger.exception("LLM flashcard generation failed")
+            logger.exception("LLM flashcard generation failed")
             msg = f"Failed to generate flashcards with LLM: {e}"
             raise GenerateFlashcardsError(msg) from e
         else:
             return flashcards
-
-    def _validate_flashcards(
-        self,
-        flashcards: list[dict[str, str]],
-        session_id: int,
-    ) -> list[dict[str, str]]:
-        """Validate generated flashcards against model constraints.
-
-        Filters out flashcards that don't meet the required constraints:
-        - front: non-empty, max MAX_FRONT_LENGTH characters
-        - back: non-empty, max MAX_BACK_LENGTH characters
-
-        Args:
-            flashcards: List of flashcard dictionaries to validate
-            session_id: Session ID for logging purposes
-
-        Returns:
-            List of valid flashcard dictionaries
-        """
-        valid_flashcards = []
-
-        for idx, card in enumerate(flashcards):
-            # Check for required keys
-            if "front" not in card or "back" not in card:
-                self.logger.warning(
-                    "Flashcard %d missing required keys (session: %s)",
-                    idx,
-                    session_id,
-                )
-                continue
-
-            front = card["front"].strip()
-            back = card["back"].strip()
-
-            # Validate front field
-            if not front or len(front) > MAX_FRONT_LENGTH:
-                self.logger.warning(
-                    "Flashcard %d has invalid front field (session: %s): length=%d",
-                    idx,
-                    session_id,
-                    len(front),
-                )
-                continue
-
-            # Validate back field
-            if not back or len(back) > MAX_BACK_LENGTH:
-                self.logger.warning(
-                    "Flashcard %d has invalid back field (session: %s): length=%d",
-                    idx,
-                    session_id,
-                    len(back),
-                )
-                continue
-
-            valid_flashcards.append({"front": front, "back": back})
-
-        return valid_flashcards
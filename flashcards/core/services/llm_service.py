@@ -1,10 +1,16 @@
 """LLM service for interacting with Google's Gemini API."""
 
+import functools
+import hashlib
+import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 from typing import TypeVar
 
 from django.conf import settings
+from django.core.cache import BaseCache
+from django.core.cache import cache as default_cache
 from django.core.exceptions import ImproperlyConfigured
 from google import genai
 from google.genai import errors
@@ -17,6 +23,16 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T", bound=BaseModel)
 
 
+@functools.lru_cache(maxsize=32)
+def _schema_for(response_schema: type[BaseModel]) -> dict[str, Any]:
+    """Return the JSON schema of a response schema class.
+
+    Pydantic rebuilds the schema on every model_json_schema() call, so it is
+    built once per class here. The result is shared and must not be mutated.
+    """
+    return response_schema.model_json_schema()
+
+
 class GeminiLLMService:
     """Service class for interacting with Google's Gemini API.
 
@@ -41,14 +57,19 @@ class GeminiLLMService:
     MAX_PROMPT_LENGTH = 10000
     # Maximum temperature value allowed by Gemini API
     MAX_TEMPERATURE = 2.0
+    # How long responses are cached for identical requests, in seconds
+    CACHE_TIMEOUT = 60 * 60 * 24
+    # Maximum number of concurrent API requests made by batch methods
+    MAX_BATCH_CONCURRENCY = 8
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         api_key: str | None = None,
         model: str = "gemini-2.0-flash-001",
         system_instruction: str | None = None,
         temperature: float = 0.7,
         max_output_tokens: int = 2048,
+        cache: BaseCache | None = None,
     ):
         """Initialize the Gemini LLM service.
 
@@ -58,6 +79,8 @@ class GeminiLLMService:
             system_instruction: Optional system instruction for the model
             temperature: Temperature for generation (0.0-2.0, default: 0.7)
             max_output_tokens: Maximum tokens in response (default: 2048)
+            cache: Cache for responses to identical requests. If None, uses
+                the default Django cache
 
         Raises:
             ImproperlyConfigured: If API key is missing or invalid
@@ -86,6 +109,7 @@ class GeminiLLMService:
         self._system_instruction = system_instruction
         self._temperature = temperature
         self._max_output_tokens = max_output_tokens
+        self._cache = default_cache if cache is None else cache
 
         try:
             self._client = genai.Client(api_key=self._api_key)
@@ -104,11 +128,22 @@ class GeminiLLMService:
         """Get the default generation configuration."""
         return self._build_config()
 
-    def generate_text(self, prompt: str, **config_overrides) -> str:
+    def generate_text(
+        self,
+        prompt: str,
+        *,
+        bypass_cache: bool = False,
+        **config_overrides,
+    ) -> str:
         """Generate simple text response from a prompt.
 
+        Responses are cached, so identical requests are only sent to the API
+        once within CACHE_TIMEOUT.
+
         Args:
             prompt: The text prompt to send to the model
+            bypass_cache: Whether to skip the cache lookup and always call
+                the API (the response is still cached)
             **config_overrides: Optional config overrides (temperature, max_output_tokens, etc.)
 
         Returns:
@@ -120,6 +155,13 @@ class GeminiLLMService:
         """
         self._validate_prompt(prompt)
 
+        cache_key = self._cache_key(prompt, config_overrides)
+        if not bypass_cache:
+            cached_text = self._cache.get(cache_key)
+            if cached_text is not None:
+                logger.debug("Using cached text response for model=%s", self._model)
+                return cached_text
+
         config = self._build_config(**config_overrides)
 
         try:
@@ -140,6 +182,7 @@ class GeminiLLMService:
                 "Successfully generated text, response_length=%d",
                 len(response.text),
             )
+            self._cache.set(cache_key, response.text, self.CACHE_TIMEOUT)
             return response.text  # noqa: TRY300
 
         except errors.APIError as e:
@@ -153,17 +196,66 @@ class GeminiLLMService:
             )
             raise
 
+    def generate_text_batch(self, prompts: list[str], **config_overrides) -> list[str]:
+        """Generate text responses for several prompts concurrently.
+
+        Each distinct prompt is sent as its own request, as a list of
+        contents in a single request would be treated as one multi-turn
+        conversation. Up to MAX_BATCH_CONCURRENCY requests are in flight at a
+        time.
+
+        Args:
+            prompts: The text prompts to send to the model
+            **config_overrides: Optional config overrides applied to every
+                request (temperature, max_output_tokens, etc.)
+
+        Returns:
+            Generated text responses, in the same order as the prompts
+
+        Raises:
+            ValueError: If any prompt is invalid, before any request is made
+            google.api_core.exceptions.GoogleAPIError: For API failures
+        """
+        for prompt in prompts:
+            self._validate_prompt(prompt)
+
+        if not prompts:
+            return []
+
+        # Identical prompts are only sent once
+        unique_prompts = list(dict.fromkeys(prompts))
+        max_workers = min(self.MAX_BATCH_CONCURRENCY, len(unique_prompts))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            responses = dict(
+                zip(
+                    unique_prompts,
+                    executor.map(
+                        lambda prompt: self.generate_text(prompt, **config_overrides),
+                        unique_prompts,
+                    ),
+                    strict=True,
+                ),
+            )
+        return [responses[prompt] for prompt in prompts]
+
     def generate_structured(
         self,
         prompt: str,
         response_schema: type[T],
+        *,
+        bypass_cache: bool = False,
         **config_overrides,
     ) -> T:
         """Generate response conforming to a Pydantic schema.
 
+        Responses are cached, so identical requests are only sent to the API
+        once within CACHE_TIMEOUT.
+
         Args:
             prompt: The text prompt to send to the model
             response_schema: Pydantic BaseModel class defining the expected structure
+            bypass_cache: Whether to skip the cache lookup and always call
+                the API (the response is still cached)
             **config_overrides: Optional config overrides (temperature, max_output_tokens, etc.)
 
         Returns:
@@ -180,6 +272,17 @@ class GeminiLLMService:
             msg = "response_schema must be a Pydantic BaseModel subclass"
             raise TypeError(msg)
 
+        cache_key = self._cache_key(prompt, config_overrides, response_schema)
+        if not bypass_cache:
+            cached_json = self._cache.get(cache_key)
+            if cached_json is not None:
+                logger.debug(
+                    "Using cached structured response for model=%s, schema=%s",
+                    self._model,
+                    response_schema.__name__,
+                )
+                return response_schema.model_validate_json(cached_json)
+
         config = self._build_config(
             response_mime_type="application/json",
             response_schema=response_schema,
@@ -223,6 +326,11 @@ class GeminiLLMService:
                     "Successfully generated and validated structured output for schema=%s",
                     response_schema.__name__,
                 )
+                self._cache.set(
+                    cache_key,
+                    validated_result.model_dump_json(),
+                    self.CACHE_TIMEOUT,
+                )
                 return validated_result
 
         except errors.APIError as e:
@@ -244,6 +352,33 @@ class GeminiLLMService:
             )
             raise
 
+    def _cache_key(
+        self,
+        prompt: str,
+        config_overrides: dict[str, Any],
+        response_schema: type[BaseModel] | None = None,
+    ) -> str:
+        """Return the cache key for a request.
+
+        The key covers everything that determines the response: model,
+        generation config, response schema and prompt.
+        """
+        request = {
+            "model": self._model,
+            "system_instruction": self._system_instruction,
+            "temperature": self._temperature,
+            "max_output_tokens": self._max_output_tokens,
+            "config_overrides": config_overrides,
+            "response_schema": (
+                _schema_for(response_schema) if response_schema else None
+            ),
+            "prompt": prompt,
+        }
+        digest = hashlib.sha256(
+            json.dumps(request, sort_keys=True, default=str).encode(),
+        ).hexdigest()
+        return f"gemini:{digest}"
+
     def _build_config(self, **overrides: Any) -> types.GenerateContentConfig:
         """Build generation configuration with optional overrides.
 
@@ -0,0 +1,20 @@
+"""Signal handlers for the core flashcard app."""
+
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from flashcards.core.models import Flashcard
+from flashcards.core.pagination import invalidate_flashcard_list
+
+
+@receiver(post_save, sender=Flashcard)
+def invalidate_cached_flashcard_list(sender, instance, **kwargs):
+    """Drop the owner's cached flashcard list when a flashcard is saved.
+
+    Bulk operations (bulk_create(), update()) don't send this signal, so
+    code using them for ready flashcards invalidates the list itself. The
+    same goes for deletions, including those made from the admin: a
+    post_delete receiver would stop Django from deleting flashcards with a
+    single DELETE query.
+    """
+    invalidate_flashcard_list(instance.user_id)
@@ -0,0 +1,152 @@
+"""Tests for core admin configuration."""
+
+from http import HTTPStatus
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from flashcards.core.models import AIGenerationSession
+from flashcards.core.models import Flashcard
+from flashcards.core.pagination import flashcard_list_cache_key
+
+pytestmark = pytest.mark.django_db
+
+
+def _create_ai_flashcard(user, index):
+    session = AIGenerationSession.objects.create(
+        user=user,
+        input_text=f"Input text {index}",
+        model="mock_model",
+        generated_count=1,
+    )
+    return Flashcard.objects.create(
+        user=user,
+        front=f"Question {index}",
+        back=f"Answer {index}",
+        creation_method=Flashcard.AI_FULL,
+        ai_session=session,
+        ai_review_state=Flashcard.ACCEPTED,
+    )
+
+
+def _count_changelist_queries(client, url):
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(url)
+    assert response.status_code == HTTPStatus.OK
+    return len(context.captured_queries)
+
+
+class TestFlashcardAdmin:
+    def test_changelist(self, admin_client, admin_user):
+        flashcard = _create_ai_flashcard(admin_user, 0)
+
+        url = reverse("admin:core_flashcard_changelist")
+        response = admin_client.get(url)
+
+        assert response.status_code == HTTPStatus.OK
+        session_url = reverse(
+            "admin:core_aigenerationsession_change",
+            args=[flashcard.ai_session_id],
+        )
+        assert session_url in response.content.decode()
+
+    def test_changelist_truncates_long_text(self, admin_client, admin_user):
+        Flashcard.objects.create(
+            user=admin_user,
+            front="F" * 60,
+            back="B" * 50,
+            creation_method=Flashcard.MANUAL,
+        )
+
+        url = reverse("admin:core_flashcard_changelist")
+        response = admin_client.get(url)
+
+        content = response.content.decode()
+        assert f"{'F' * 47}..." in content
+        assert "F" * 48 not in content
+        assert "B" * 50 in content
+        assert f"{'B' * 47}..." not in content
+
+    def test_changelist_query_count_independent_of_rows(
+        self,
+        admin_client,
+        admin_user,
+    ):
+        url = reverse("admin:core_flashcard_changelist")
+        _create_ai_flashcard(admin_user, 0)
+        queries_for_one_row = _count_changelist_queries(admin_client, url)
+
+        for index in range(1, 10):
+            _create_ai_flashcard(admin_user, index)
+
+        assert _count_changelist_queries(admin_client, url) == queries_for_one_row
+
+
+    def test_delete_invalidates_cached_list(
+        self,
+        admin_client,
+        admin_user,
+        django_capture_on_commit_callbacks,
+    ):
+        flashcard = _create_ai_flashcard(admin_user, 0)
+        key = flashcard_list_cache_key(admin_user.pk)
+        cache.set(key, (flashcard.pk,))
+
+        url = reverse("admin:core_flashcard_delete", args=[flashcard.pk])
+        with django_capture_on_commit_callbacks(execute=True):
+            response = admin_client.post(url, {"post": "yes"})
+
+        assert response.status_code == HTTPStatus.FOUND
+        assert cache.get(key) is None
+
+    def test_delete_selected_invalidates_cached_list(
+        self,
+        admin_client,
+        admin_user,
+        django_capture_on_commit_callbacks,
+    ):
+        flashcards = [_create_ai_flashcard(admin_user, index) for index in range(2)]
+        key = flashcard_list_cache_key(admin_user.pk)
+        cache.set(key, tuple(flashcard.pk for flashcard in flashcards))
+
+        url = reverse("admin:core_flashcard_changelist")
+        with django_capture_on_commit_callbacks(execute=True):
+            response = admin_client.post(
+                url,
+                {
+                    "action": "delete_selected",
+                    "_selected_action": [flashcard.pk for flashcard in flashcards],
+                    "post": "yes",
+                },
+            )
+
+        assert response.status_code == HTTPStatus.FOUND
+        assert not Flashcard.objects.exists()
+        assert cache.get(key) is None
+
+
+class TestAIGenerationSessionAdmin:
+    def test_changelist(self, admin_client, admin_user):
+        _create_ai_flashcard(admin_user, 0)
+
+        url = reverse("admin:core_aigenerationsession_changelist")
+        response = admin_client.get(url)
+
+        assert response.status_code == HTTPStatus.OK
+
+    def test_changelist_query_count_independent_of_rows(
+        self,
+        admin_client,
+        admin_user,
+    ):
+        url = reverse("admin:core_aigenerationsession_changelist")
+        _create_ai_flashcard(admin_user, 0)
+        queries_for_one_row = _count_changelist_queries(admin_client, url)
+
+        for index in range(1, 10):
+            _create_ai_flashcard(admin_user, index)
+
+        assert _count_changelist_queries(admin_client, url) == queries_for_one_row
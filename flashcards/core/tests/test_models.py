@@ -0,0 +1,46 @@
+"""Tests for core models."""
+
+import pytest
+from django.db import IntegrityError
+
+from flashcards.core.models import AIGenerationSession
+from flashcards.core.models import Flashcard
+from flashcards.users.tests.factories import UserFactory
+
+pytestmark = pytest.mark.django_db
+
+
+class TestFlashcard:
+    """Tests for the Flashcard model."""
+
+    @pytest.mark.parametrize("field", ["front", "back"])
+    @pytest.mark.parametrize("value", ["", "   ", "\n\t"])
+    def test_blank_text_rejected_by_database(self, field, value):
+        """Blank front or back text should violate a check constraint."""
+        flashcard = Flashcard(
+            user=UserFactory(),
+            front="Question",
+            back="Answer",
+            creation_method=Flashcard.MANUAL,
+        )
+        setattr(flashcard, field, value)
+
+        with pytest.raises(IntegrityError, match=f"flashcard_{field}_not_blank"):
+            flashcard.save()
+
+
+class TestAIGenerationSession:
+    """Tests for the AIGenerationSession model."""
+
+    @pytest.mark.parametrize(
+        ("accepted_count", "reviewed_count", "expected"),
+        [(1, 4, 25.0), (3, 3, 100.0), (0, 2, 0.0), (0, 0, None)],
+    )
+    def test_acceptance_rate(self, accepted_count, reviewed_count, expected):
+        """Acceptance rate should be the percentage of reviewed cards accepted."""
+        session = AIGenerationSession(
+            accepted_count=accepted_count,
+            reviewed_count=reviewed_count,
+        )
+
+        assert session.acceptance_rate == expected
@@ -0,0 +1,301 @@
+"""Tests for core services."""
+
+import hashlib
+from types import SimpleNamespace
+
+import pytest
+from django.core.cache.backends.locmem import LocMemCache
+from pydantic import ValidationError
+
+from flashcards.core.models import AIGenerationSession
+from flashcards.core.models import Flashcard
+from flashcards.core.services.flashcard_generation import FlashcardGenerationResponse
+from flashcards.core.services.flashcard_generation import FlashcardGenerationService
+from flashcards.core.services.flashcard_generation import FlashcardSchema
+from flashcards.core.services.flashcard_generation import GenerateFlashcardsCommand
+from flashcards.core.services.flashcard_generation import _get_llm_service
+from flashcards.core.services.llm_service import GeminiLLMService
+from flashcards.users.tests.factories import UserFactory
+
+pytestmark = pytest.mark.django_db
+
+
+class FakeLLMService:
+    """Stand-in for GeminiLLMService returning a fixed structured response."""
+
+    def __init__(self, flashcards):
+        self.flashcards = flashcards
+        self.calls = 0
+
+    def generate_structured(self, prompt, response_schema):
+        self.calls += 1
+        return response_schema(flashcards=self.flashcards)
+
+
+class FailingLLMService:
+    """Stand-in for GeminiLLMService whose API calls always fail."""
+
+    def generate_structured(self, prompt, response_schema):
+        msg = "API unavailable"
+        raise RuntimeError(msg)
+
+
+def _flashcards(count):
+    return [
+        FlashcardSchema(front=f"Question {index}", back=f"Answer {index}")
+        for index in range(count)
+    ]
+
+
+class TestFlashcardSchema:
+    """Tests for FlashcardSchema validation."""
+
+    def test_strips_whitespace(self):
+        """Front and back text should be trimmed."""
+        card = FlashcardSchema(front="  Question \n", back="\tAnswer ")
+
+        assert card.front == "Question"
+        assert card.back == "Answer"
+
+    @pytest.mark.parametrize(
+        ("front", "back"),
+        [
+            ("   ", "Answer"),
+            ("Question", ""),
+            ("Q" * 201, "Answer"),
+            ("Question", "A" * 501),
+        ],
+    )
+    def test_rejects_invalid_text(self, front, back):
+        """Blank or too long text should fail validation."""
+        with pytest.raises(ValidationError):
+            FlashcardSchema(front=front, back=back)
+
+    def test_rejects_unknown_fields(self):
+        """Fields outside the schema should fail validation."""
+        with pytest.raises(ValidationError):
+            FlashcardSchema.model_validate(
+                {"front": "Question", "back": "Answer", "hint": "Think"},
+            )
+
+
+class TestFlashcardGenerationService:
+    """Tests for FlashcardGenerationService."""
+
+    def test_generate_flashcards_stores_pending_flashcards(self):
+        """Generated flashcards should be stored for review with the session."""
+        user = UserFactory()
+        service = FlashcardGenerationService(llm_service=FakeLLMService(_flashcards(5)))
+
+        result = service.generate_flashcards(
+            GenerateFlashcardsCommand(user=user, input_text="Some text"),
+        )
+
+        assert result.success
+        assert result.generated_count == 5  # noqa: PLR2004
+        assert result.flashcards[0] == {"front": "Question 0", "back": "Answer 0"}
+        session = AIGenerationSession.objects.get(pk=result.session_id)
+        assert session.generated_count == 5  # noqa: PLR2004
+        assert session.input_text_hash == hashlib.sha256(b"Some text").hexdigest()
+        flashcards = Flashcard.objects.filter(ai_session=session)
+        assert flashcards.count() == 5  # noqa: PLR2004
+        assert all(
+            flashcard.user == user
+            and flashcard.creation_method == Flashcard.AI_FULL
+            and flashcard.ai_review_state == Flashcard.PENDING
+            for flashcard in flashcards
+        )
+
+    def test_generate_flashcards_query_count(self, django_assert_num_queries):
+        """Besides the lookup for a previous generation, the session and its
+        flashcards should take one INSERT each."""
+        user = UserFactory()
+        service = FlashcardGenerationService(llm_service=FakeLLMService(_flashcards(5)))
+        command = GenerateFlashcardsCommand(user=user, input_text="Some text")
+
+        with django_assert_num_queries(3):
+            service.generate_flashcards(command)
+
+    def test_generate_flashcards_bulk(self, django_assert_num_queries):
+        """Results of all commands should be stored with one INSERT per model."""
+        users = [UserFactory(), UserFactory()]
+        service = FlashcardGenerationService(llm_service=FakeLLMService(_flashcards(5)))
+        commands = [
+            GenerateFlashcardsCommand(user=user, input_text="Some text")
+            for user in users
+        ]
+
+        # One lookup for a previous generation per command, then the INSERTs
+        with django_assert_num_queries(4):
+            results = service.generate_flashcards_bulk(commands)
+
+        assert [result.success for result in results] == [True, True]
+        for user, result in zip(users, results, strict=True):
+            session = AIGenerationSession.objects.get(pk=result.session_id)
+            assert session.user == user
+            assert Flashcard.objects.filter(ai_session=session, user=user).count() == 5  # noqa: PLR2004
+
+    def test_generate_flashcards_bulk_generates_duplicates_once(self):
+        """Commands with the same input text should share one AI call."""
+        users = [UserFactory(), UserFactory()]
+        llm_service = FakeLLMService(_flashcards(5))
+        service = FlashcardGenerationService(llm_service=llm_service)
+        commands = [
+            GenerateFlashcardsCommand(user=users[0], input_text="Some text"),
+            GenerateFlashcardsCommand(user=users[1], input_text="Some text"),
+            GenerateFlashcardsCommand(user=users[1], input_text="Other text"),
+        ]
+
+        results = service.generate_flashcards_bulk(commands)
+
+        assert llm_service.calls == 2  # noqa: PLR2004
+        assert len({result.session_id for result in results}) == 3  # noqa: PLR2004
+        assert AIGenerationSession.objects.get(pk=results[1].session_id).user == users[1]
+        assert Flashcard.objects.filter(ai_session_id=results[1].session_id).count() == 5  # noqa: PLR2004
+
+    def test_generate_flashcards_reuses_previous_generation(self):
+        """Repeated input text should reuse the flashcards without an AI call."""
+        user = UserFactory()
+        command = GenerateFlashcardsCommand(user=user, input_text="Some text")
+        first = FlashcardGenerationService(
+            llm_service=FakeLLMService(_flashcards(5)),
+        ).generate_flashcards(command)
+
+        service = FlashcardGenerationService(llm_service=FailingLLMService())
+        result = service.generate_flashcards(command)
+
+        assert result.success
+        assert result.session_id != first.session_id
+        assert result.flashcards == first.flashcards
+        assert result.api_response_time_ms == 0
+        assert Flashcard.objects.filter(ai_session_id=result.session_id).count() == 5  # noqa: PLR2004
+
+    def test_generate_flashcards_skips_edited_previous_generation(self):
+        """Sessions whose flashcards were edited should not be reused."""
+        user = UserFactory()
+        command = GenerateFlashcardsCommand(user=user, input_text="Some text")
+        first = FlashcardGenerationService(
+            llm_service=FakeLLMService(_flashcards(5)),
+        ).generate_flashcards(command)
+        assert first.success
+        Flashcard.objects.filter(ai_session_id=first.session_id).filter(
+            front="Question 0",
+        ).update(front="Edited", creation_method=Flashcard.AI_EDITED)
+
+        service = FlashcardGenerationService(llm_service=FailingLLMService())
+        result = service.generate_flashcards(command)
+
+        assert not result.success
+
+    def test_generate_flashcards_records_llm_failure(self):
+        """LLM failures should be reported and recorded on the session."""
+        service = FlashcardGenerationService(llm_service=FailingLLMService())
+
+        result = service.generate_flashcards(
+            GenerateFlashcardsCommand(user=UserFactory(), input_text="Some text"),
+        )
+
+        assert not result.success
+        assert result.error_code == "ai_generation_failed"
+        session = AIGenerationSession.objects.get(pk=result.session_id)
+        assert session.error_code == "ai_generation_failed"
+        assert "API unavailable" in session.error_message
+        assert not Flashcard.objects.filter(ai_session=session).exists()
+
+
+class TestGetLLMService:
+    """Tests for the shared LLM service factory."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self, settings):
+        settings.GEMINI_API_KEY = "test-api-key"
+        _get_llm_service.cache_clear()
+        yield
+        _get_llm_service.cache_clear()
+
+    def test_reuses_service_per_model(self):
+        """Services should be shared per model name."""
+        service = _get_llm_service("gemini-2.0-flash-001")
+
+        assert _get_llm_service("gemini-2.0-flash-001") is service
+        assert _get_llm_service("gemini-2.5-flash").model == "gemini-2.5-flash"
+
+
+class FakeGenerateContent:
+    """Stand-in for the Gemini client's generate_content, counting calls."""
+
+    def __init__(self, text):
+        self.text = text
+        self.calls = 0
+
+    def __call__(self, model, contents, config):
+        self.calls += 1
+        return SimpleNamespace(
+            text=self.text,
+            parsed=FlashcardGenerationResponse.model_validate_json(self.text),
+        )
+
+
+class TestGeminiLLMService:
+    """Tests for GeminiLLMService."""
+
+    @pytest.fixture
+    def generate_content(self):
+        response = FlashcardGenerationResponse(flashcards=_flashcards(5))
+        return FakeGenerateContent(response.model_dump_json())
+
+    @pytest.fixture
+    def service(self, generate_content, monkeypatch):
+        # Local memory caches with the same name share storage
+        cache = LocMemCache("test-llm-service", {})
+        cache.clear()
+        service = GeminiLLMService(api_key="test-api-key", cache=cache)
+        monkeypatch.setattr(service._client.models, "generate_content", generate_content)  # noqa: SLF001
+        return service
+
+    def test_generate_text_caches_identical_prompts(self, service, generate_content):
+        """Identical prompts should only be sent to the API once."""
+        first = service.generate_text("Some prompt")
+        second = service.generate_text("Some prompt")
+        service.generate_text("Another prompt")
+
+        assert first == second == generate_content.text
+        assert generate_content.calls == 2  # noqa: PLR2004
+
+    def test_generate_text_bypass_cache(self, service, generate_content):
+        """bypass_cache should always call the API."""
+        service.generate_text("Some prompt")
+        service.generate_text("Some prompt", bypass_cache=True)
+
+        assert generate_content.calls == 2  # noqa: PLR2004
+
+    def test_generate_structured_caches_identical_prompts(
+        self,
+        service,
+        generate_content,
+    ):
+        """Cached structured responses should be rehydrated into the schema."""
+        first = service.generate_structured("Some prompt", FlashcardGenerationResponse)
+        second = service.generate_structured("Some prompt", FlashcardGenerationResponse)
+
+        assert isinstance(second, FlashcardGenerationResponse)
+        assert first == second
+        assert generate_content.calls == 1
+
+    def test_generate_text_batch(self, service, generate_content):
+        """Batches should return one response per prompt, in order."""
+        responses = service.generate_text_batch(["First", "Second", "Third"])
+
+        assert responses == [generate_content.text] * 3
+        assert generate_content.calls == 3  # noqa: PLR2004
+
+    def test_generate_text_batch_sends_duplicates_once(
+        self,
+        service,
+        generate_content,
+    ):
+        """Repeated prompts in a batch should share one API call."""
+        responses = service.generate_text_batch(["First", "First"], bypass_cache=True)
+
+        assert len(responses) == 2  # noqa: PLR2004
+        assert generate_content.calls == 1
@@ -1,9 +1,14 @@
 """Tests for core flashcard views."""
 
 import pytest
+from django.test import Client
 from django.urls import reverse
 
+from flashcards.core.models import MAX_INPUT_TEXT_LENGTH
+from flashcards.core.models import AIGenerationSession
 from flashcards.core.models import Flashcard
+from flashcards.core.pagination import CachedPKPaginator
+from flashcards.core.views.generate_input import MAX_REQUEST_BODY_SIZE
 from flashcards.users.tests.factories import UserFactory
 
 pytestmark = pytest.mark.django_db
@@ -37,6 +42,27 @@ class TestFlashcardListView:
         assert response.status_code == 200
         assert flashcard.front in response.content.decode()
 
+    def test_renders_without_deferred_field_queries(
+        self,
+        client,
+        django_assert_num_queries,
+    ):
+        """Rendering a page should not load deferred fields per flashcard."""
+        user = UserFactory()
+        for i in range(3):
+            Flashcard.objects.create(
+                user=user,
+                front=f"Question {i}",
+                back=f"Answer {i}",
+                creation_method=Flashcard.MANUAL,
+            )
+
+        client.force_login(user)
+        # Session and user lookups in a savepoint, the flashcard IDs and the
+        # page of flashcards
+        with django_assert_num_queries(6):
+            client.get(reverse("core:flashcard-list"))
+
     def test_does_not_display_other_users_flashcards(self, client):
         """Users should not see other users' flashcards."""
         user1 = UserFactory()
@@ -78,14 +104,15 @@ class TestFlashcardListView:
         """Pagination should display correct number of flashcards per page."""
         user = UserFactory()
 
-        # Create 30 flashcards
-        for i in range(30):
-            Flashcard.objects.create(
+        Flashcard.objects.bulk_create(
+            Flashcard(
                 user=user,
                 front=f"Question {i}",
                 back=f"Answer {i}",
                 creation_method=Flashcard.MANUAL,
             )
+            for i in range(30)
+        )
 
         client.force_login(user)
         url = reverse("core:flashcard-list")
@@ -95,18 +122,38 @@ class TestFlashcardListView:
         assert response.context["is_paginated"] is True
         assert len(response.context["flashcards"]) == 25
 
+    def test_later_pages_keep_newest_first_order(self, client):
+        """Pages fetched by cached ID should keep the list ordering."""
+        user = UserFactory()
+        for i in range(30):
+            Flashcard.objects.create(
+                user=user,
+                front=f"Question {i}",
+                back=f"Answer {i}",
+                creation_method=Flashcard.MANUAL,
+            )
+
+        client.force_login(user)
+        url = reverse("core:flashcard-list")
+        client.get(url)
+        response = client.get(url, {"page": "2"})
+
+        fronts = [flashcard["front"] for flashcard in response.context["flashcards"]]
+        assert fronts == [f"Question {i}" for i in range(4, -1, -1)]
+
     def test_page_size_parameter(self, client):
         """Page size can be customized via query parameter."""
         user = UserFactory()
 
-        # Create 60 flashcards
-        for i in range(60):
-            Flashcard.objects.create(
+        Flashcard.objects.bulk_create(
+            Flashcard(
                 user=user,
                 front=f"Question {i}",
                 back=f"Answer {i}",
                 creation_method=Flashcard.MANUAL,
             )
+            for i in range(60)
+        )
 
         client.force_login(user)
         url = reverse("core:flashcard-list")
@@ -119,14 +166,15 @@ class TestFlashcardListView:
         """Page size should be clamped to 25-50 range."""
         user = UserFactory()
 
-        # Create 60 flashcards
-        for i in range(60):
-            Flashcard.objects.create(
+        Flashcard.objects.bulk_create(
+            Flashcard(
                 user=user,
                 front=f"Question {i}",
                 back=f"Answer {i}",
                 creation_method=Flashcard.MANUAL,
             )
+            for i in range(60)
+        )
 
         client.force_login(user)
         url = reverse("core:flashcard-list")
@@ -139,6 +187,76 @@ class TestFlashcardListView:
         response = client.get(url, {"page_size": "10"})
         assert len(response.context["flashcards"]) == 25
 
+    def test_flashcard_ids_are_cached(self, client, django_assert_num_queries):
+        """Repeated renders should reuse the cached flashcard IDs and count."""
+        user = UserFactory()
+        Flashcard.objects.create(
+            user=user,
+            front="Test Question",
+            back="Test Answer",
+            creation_method=Flashcard.MANUAL,
+        )
+        client.force_login(user)
+        url = reverse("core:flashcard-list")
+        client.get(url)
+
+        # Session and user lookups in a savepoint, then the page of
+        # flashcards, without a COUNT(*)
+        with django_assert_num_queries(5):
+            response = client.get(url)
+
+        assert response.context["total_count"] == 1
+
+    def test_count_updated_after_changes(
+        self,
+        client,
+        django_capture_on_commit_callbacks,
+    ):
+        """Creating and deleting flashcards should refresh the count."""
+        user = UserFactory()
+        client.force_login(user)
+        url = reverse("core:flashcard-list")
+        assert client.get(url).context["total_count"] == 0
+
+        with django_capture_on_commit_callbacks(execute=True):
+            flashcard = Flashcard.objects.create(
+                user=user,
+                front="Test Question",
+                back="Test Answer",
+                creation_method=Flashcard.MANUAL,
+            )
+        assert client.get(url).context["total_count"] == 1
+
+        delete_url = reverse("core:flashcard-delete", kwargs={"pk": flashcard.pk})
+        with django_capture_on_commit_callbacks(execute=True):
+            client.delete(delete_url)
+        assert client.get(url).context["total_count"] == 0
+
+    def test_cache_invalidated_on_commit(
+        self,
+        client,
+        django_capture_on_commit_callbacks,
+    ):
+        """The cached list should only be dropped once the change commits."""
+        user = UserFactory()
+        client.force_login(user)
+        url = reverse("core:flashcard-list")
+        client.get(url)
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            Flashcard.objects.create(
+                user=user,
+                front="Test Question",
+                back="Test Answer",
+                creation_method=Flashcard.MANUAL,
+            )
+            # Not committed yet, so the cached (empty) list is still served
+            assert client.get(url).context["total_count"] == 0
+
+        for callback in callbacks:
+            callback()
+        assert client.get(url).context["total_count"] == 1
+
     def test_htmx_request_returns_fragment(self, client):
         """HTMX requests should return fragment template."""
         user = UserFactory()
@@ -158,6 +276,79 @@ class TestFlashcardListView:
             t.name for t in response.templates
         ]
 
+    def test_htmx_fragment_is_cached(self, client, django_assert_num_queries):
+        """Unchanged lists should be served from the fragment cache."""
+        user = UserFactory()
+        Flashcard.objects.create(
+            user=user,
+            front="Test Question",
+            back="Test Answer",
+            creation_method=Flashcard.MANUAL,
+        )
+        client.force_login(user)
+        url = reverse("core:flashcard-list")
+        first = client.get(url, HTTP_HX_REQUEST="true")
+
+        # Only the session and user lookups, in a savepoint
+        with django_assert_num_queries(4):
+            second = client.get(url, HTTP_HX_REQUEST="true")
+
+        assert second.content == first.content
+
+    def test_htmx_fragment_builds_one_paginator(self, client, monkeypatch):
+        """Rendering an uncached fragment should reuse the paginator."""
+        paginators = []
+        original_init = CachedPKPaginator.__init__
+
+        def init(self, *args, **kwargs):
+            paginators.append(self)
+            original_init(self, *args, **kwargs)
+
+        monkeypatch.setattr(CachedPKPaginator, "__init__", init)
+
+        client.force_login(UserFactory())
+        response = client.get(reverse("core:flashcard-list"), HTTP_HX_REQUEST="true")
+
+        assert response.status_code == 200
+        assert len(paginators) == 1
+
+    def test_htmx_fragment_not_modified(self, client):
+        """Fragments should be revalidated with their ETag."""
+        user = UserFactory()
+        client.force_login(user)
+        url = reverse("core:flashcard-list")
+        etag = client.get(url, HTTP_HX_REQUEST="true")["ETag"]
+
+        response = client.get(url, HTTP_HX_REQUEST="true", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+        assert response["ETag"] == etag
+
+    def test_htmx_fragment_updated_after_changes(
+        self,
+        client,
+        django_capture_on_commit_callbacks,
+    ):
+        """Changes to the flashcards should not serve a stale fragment."""
+        user = UserFactory()
+        flashcard = Flashcard.objects.create(
+            user=user,
+            front="Old Question",
+            back="Test Answer",
+            creation_method=Flashcard.MANUAL,
+        )
+        client.force_login(user)
+        url = reverse("core:flashcard-list")
+        etag = client.get(url, HTTP_HX_REQUEST="true")["ETag"]
+
+        flashcard.front = "New Question"
+        with django_capture_on_commit_callbacks(execute=True):
+            flashcard.save()
+        response = client.get(url, HTTP_HX_REQUEST="true", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert "New Question" in response.content.decode()
+
 
 class TestFlashcardDeleteView:
     """Tests for FlashcardDeleteView."""
@@ -195,6 +386,22 @@ class TestFlashcardDeleteView:
         assert response.status_code == 200
         assert not Flashcard.objects.filter(pk=flashcard.pk).exists()
 
+    def test_deletes_with_single_query(self, client, django_assert_num_queries):
+        """Deleting should not fetch the flashcard before the DELETE."""
+        user = UserFactory()
+        flashcard = Flashcard.objects.create(
+            user=user,
+            front="Test Question",
+            back="Test Answer",
+            creation_method=Flashcard.MANUAL,
+        )
+
+        client.force_login(user)
+        url = reverse("core:flashcard-delete", kwargs={"pk": flashcard.pk})
+        # Session and user lookups in a savepoint, then the DELETE
+        with django_assert_num_queries(5):
+            client.delete(url)
+
     def test_cannot_delete_other_users_flashcard(self, client):
         """Users should not be able to delete other users' flashcards."""
         user1 = UserFactory()
@@ -237,3 +444,352 @@ class TestFlashcardDeleteView:
         assert response.status_code == 200
         content = response.content.decode()
         assert len(content) == 0
+
+
+def _create_pending_flashcard(user, front="Question", back="Answer"):
+    session = AIGenerationSession.objects.create(
+        user=user,
+        input_text="Input text",
+        model="mock_model",
+        generated_count=1,
+    )
+    return Flashcard.objects.create(
+        user=user,
+        front=front,
+        back=back,
+        creation_method=Flashcard.AI_FULL,
+        ai_session=session,
+        ai_review_state=Flashcard.PENDING,
+    )
+
+
+class TestGenerateFlashcardsInputView:
+    """Tests for GenerateFlashcardsInputView."""
+
+    def test_oversized_body_rejected_before_parsing(self, client):
+        """Bodies larger than any valid submission should return 400."""
+        client.force_login(UserFactory())
+        response = client.post(
+            reverse("core:generate-input"),
+            {"input_text": "x" * MAX_REQUEST_BODY_SIZE},
+        )
+
+        assert response.status_code == 400
+
+    def test_oversized_body_rejected_before_csrf_check(self):
+        """The size check should run before CSRF validation reads the body."""
+        client = Client(enforce_csrf_checks=True)
+        client.force_login(UserFactory())
+        response = client.post(
+            reverse("core:generate-input"),
+            {"input_text": "x" * MAX_REQUEST_BODY_SIZE},
+        )
+
+        assert response.status_code == 400
+
+    def test_oversized_body_from_anonymous_user_redirects(self, client):
+        """Anonymous users should be sent to login, whatever the body size."""
+        response = client.post(
+            reverse("core:generate-input"),
+            {"input_text": "x" * MAX_REQUEST_BODY_SIZE},
+        )
+
+        assert response.status_code == 302
+        assert response["Location"].startswith(reverse("account_login"))
+
+    def test_long_non_ascii_input_reaches_form_validation(self, client):
+        """Percent-encoded non-ASCII text shouldn't trip the body size guard."""
+        client.force_login(UserFactory())
+        response = client.post(
+            reverse("core:generate-input"),
+            {"input_text": "ś" * (MAX_INPUT_TEXT_LENGTH + 1)},
+        )
+
+        assert response.status_code == 200
+        assert "Input text too long (max 10,000 characters)." in (
+            response.content.decode()
+        )
+
+
+class TestGenerateFlashcardsReviewView:
+    """Tests for GenerateFlashcardsReviewView."""
+
+    def test_displays_pending_flashcards(self, client):
+        """Owners should see the session's flashcards pending review."""
+        user = UserFactory()
+        flashcard = _create_pending_flashcard(user, front="Pending question")
+
+        client.force_login(user)
+        url = reverse(
+            "core:generate-review",
+            kwargs={"session_id": flashcard.ai_session_id},
+        )
+        response = client.get(url)
+
+        assert response.status_code == 200
+        assert "Pending question" in response.content.decode()
+
+    def test_query_count(self, client, django_assert_num_queries):
+        """The session and its pending flashcards should take one query each."""
+        user = UserFactory()
+        flashcard = _create_pending_flashcard(user)
+
+        client.force_login(user)
+        url = reverse(
+            "core:generate-review",
+            kwargs={"session_id": flashcard.ai_session_id},
+        )
+        # Session and user lookups in a savepoint, then the generation
+        # session and its flashcards
+        with django_assert_num_queries(6):
+            client.get(url)
+
+    def test_other_users_session_forbidden(self, client):
+        """Users should not be able to review other users' sessions."""
+        flashcard = _create_pending_flashcard(UserFactory())
+
+        client.force_login(UserFactory())
+        url = reverse(
+            "core:generate-review",
+            kwargs={"session_id": flashcard.ai_session_id},
+        )
+        response = client.get(url)
+
+        assert response.status_code == 403
+
+
+class TestAcceptFlashcardView:
+    """Tests for AcceptFlashcardView."""
+
+    def _accept(self, client, flashcard, front, back):
+        url = reverse(
+            "core:generate-accept",
+            kwargs={"session_id": flashcard.ai_session_id},
+        )
+        return client.post(
+            url,
+            {"flashcard_id": flashcard.pk, "front": front, "back": back},
+        )
+
+    def test_accepts_unedited_flashcard(self, client):
+        """Accepting without edits should keep the AI_FULL creation method."""
+        user = UserFactory()
+        flashcard = _create_pending_flashcard(user)
+
+        client.force_login(user)
+        response = self._accept(client, flashcard, "Question", "Answer")
+
+        assert response.status_code == 200
+        flashcard.refresh_from_db()
+        assert flashcard.ai_review_state == Flashcard.ACCEPTED
+        assert flashcard.creation_method == Flashcard.AI_FULL
+        assert (flashcard.front, flashcard.back) == ("Question", "Answer")
+        session = flashcard.ai_session
+        session.refresh_from_db()
+        assert (session.accepted_count, session.reviewed_count) == (1, 1)
+
+    def test_accept_query_count(self, client, django_assert_num_queries):
+        """Accepting should only update the flashcard and the session."""
+        user = UserFactory()
+        flashcard = _create_pending_flashcard(user)
+
+        client.force_login(user)
+        # Session and user lookups in a savepoint, then the two UPDATEs
+        with django_assert_num_queries(6):
+            self._accept(client, flashcard, "Question", "Answer")
+
+    def test_accepts_edited_flashcard(self, client):
+        """Accepting with edits should store them as AI_EDITED."""
+        user = UserFactory()
+        flashcard = _create_pending_flashcard(user)
+
+        client.force_login(user)
+        response = self._accept(client, flashcard, " New question ", "Answer")
+
+        assert response.status_code == 200
+        flashcard.refresh_from_db()
+        assert flashcard.ai_review_state == Flashcard.ACCEPTED
+        assert flashcard.creation_method == Flashcard.AI_EDITED
+        assert (flashcard.front, flashcard.back) == ("New question", "Answer")
+
+    def test_cannot_accept_reviewed_flashcard(self, client):
+        """Accepting an already reviewed flashcard should fail."""
+        user = UserFactory()
+        flashcard = _create_pending_flashcard(user)
+
+        client.force_login(user)
+        self._accept(client, flashcard, "Question", "Answer")
+        response = self._accept(client, flashcard, "Edited", "Answer")
+
+        assert response.status_code == 404
+        flashcard.refresh_from_db()
+        assert flashcard.front == "Question"
+        assert flashcard.ai_session.reviewed_count == 1
+
+    def test_cannot_accept_other_users_flashcard(self, client):
+        """Users should not be able to accept flashcards of other users."""
+        flashcard = _create_pending_flashcard(UserFactory())
+
+        client.force_login(UserFactory())
+        response = self._accept(client, flashcard, "Question", "Answer")
+
+        assert response.status_code == 403
+        flashcard.refresh_from_db()
+        assert flashcard.ai_review_state == Flashcard.PENDING
+
+    def test_missing_session_returns_404(self, client):
+        """Accepting in a nonexistent session should return 404."""
+        client.force_login(UserFactory())
+        url = reverse("core:generate-accept", kwargs={"session_id": 0})
+        response = client.post(
+            url,
+            {"flashcard_id": 1, "front": "Question", "back": "Answer"},
+        )
+
+        assert response.status_code == 404
+
+
+class TestRejectFlashcardView:
+    """Tests for RejectFlashcardView."""
+
+    def test_rejects_flashcard(self, client):
+        """Rejecting should update the flashcard and count the review."""
+        user = UserFactory()
+        flashcard = _create_pending_flashcard(user)
+
+        client.force_login(user)
+        url = reverse(
+            "core:generate-reject",
+            kwargs={"session_id": flashcard.ai_session_id},
+        )
+        response = client.post(url, {"flashcard_id": flashcard.pk})
+
+        assert response.status_code == 200
+        flashcard.refresh_from_db()
+        assert flashcard.ai_review_state == Flashcard.REJECTED
+        session = flashcard.ai_session
+        assert (session.accepted_count, session.reviewed_count) == (0, 1)
+
+    def test_reject_query_count(self, client, django_assert_num_queries):
+        """Rejecting should only update the flashcard and the session."""
+        user = UserFactory()
+        flashcard = _create_pending_flashcard(user)
+
+        client.force_login(user)
+        url = reverse(
+            "core:generate-reject",
+            kwargs={"session_id": flashcard.ai_session_id},
+        )
+        # Session and user lookups in a savepoint, then the two UPDATEs
+        with django_assert_num_queries(6):
+            client.post(url, {"flashcard_id": flashcard.pk})
+
+    def test_missing_session_returns_404(self, client):
+        """Rejecting in a session that doesn't exist should return 404."""
+        client.force_login(UserFactory())
+        url = reverse("core:generate-reject", kwargs={"session_id": 999999})
+        response = client.post(url, {"flashcard_id": 1})
+
+        assert response.status_code == 404
+
+    def test_cannot_reject_other_users_flashcard(self, client):
+        """Users should not be able to reject flashcards of other users."""
+        flashcard = _create_pending_flashcard(UserFactory())
+
+        client.force_login(UserFactory())
+        url = reverse(
+            "core:generate-reject",
+            kwargs={"session_id": flashcard.ai_session_id},
+        )
+        response = client.post(url, {"flashcard_id": flashcard.pk})
+
+        assert response.status_code == 403
+        flashcard.refresh_from_db()
+        assert flashcard.ai_review_state == Flashcard.PENDING
+
+    def test_cannot_reject_reviewed_flashcard(self, client):
+        """Rejecting an already reviewed flashcard should not count twice."""
+        user = UserFactory()
+        flashcard = _create_pending_flashcard(user)
+
+        client.force_login(user)
+        url = reverse(
+            "core:generate-reject",
+            kwargs={"session_id": flashcard.ai_session_id},
+        )
+        client.post(url, {"flashcard_id": flashcard.pk})
+        response = client.post(url, {"flashcard_id": flashcard.pk})
+
+        assert response.status_code == 404
+        flashcard.ai_session.refresh_from_db()
+        assert flashcard.ai_session.reviewed_count == 1
+
+    def test_get_not_allowed(self, client):
+        """Only POST requests should be accepted."""
+        flashcard = _create_pending_flashcard(UserFactory())
+
+        client.force_login(flashcard.user)
+        url = reverse(
+            "core:generate-reject",
+            kwargs={"session_id": flashcard.ai_session_id},
+        )
+
+        assert client.get(url).status_code == 405
+        assert client.options(url).status_code == 405
+
+    def test_rejects_multiple_flashcards(self, client, django_assert_num_queries):
+        """Several pending flashcards should be rejected in one request."""
+        user = UserFactory()
+        flashcard = _create_pending_flashcard(user)
+        session = flashcard.ai_session
+        others = Flashcard.objects.bulk_create(
+            Flashcard(
+                user=user,
+                front=f"Question {index}",
+                back="Answer",
+                creation_method=Flashcard.AI_FULL,
+                ai_session=session,
+                ai_review_state=Flashcard.PENDING,
+            )
+            for index in range(2)
+        )
+        Flashcard.objects.filter(pk=others[1].pk).update(
+            ai_review_state=Flashcard.ACCEPTED,
+        )
+
+        client.force_login(user)
+        url = reverse("core:generate-reject", kwargs={"session_id": session.pk})
+        flashcard_ids = [flashcard.pk, others[0].pk, others[1].pk]
+        with django_assert_num_queries(6):
+            response = client.post(url, {"flashcard_ids": flashcard_ids})
+
+        assert response.status_code == 200
+        assert response.json() == {"rejected_count": 2}
+        states = dict(
+            Flashcard.objects.filter(ai_session=session).values_list(
+                "pk",
+                "ai_review_state",
+            ),
+        )
+        assert states == {
+            flashcard.pk: Flashcard.REJECTED,
+            others[0].pk: Flashcard.REJECTED,
+            others[1].pk: Flashcard.ACCEPTED,
+        }
+        session.refresh_from_db()
+        assert session.reviewed_count == 2  # noqa: PLR2004
+
+    def test_invalid_flashcard_id_returns_400(self, client):
+        """Non-numeric flashcard IDs should be rejected."""
+        flashcard = _create_pending_flashcard(UserFactory())
+
+        client.force_login(flashcard.user)
+        url = reverse(
+            "core:generate-reject",
+            kwargs={"session_id": flashcard.ai_session_id},
+        )
+        response = client.post(url, {"flashcard_ids": [flashcard.pk, "abc"]})
+
+        assert response.status_code == 400
+        flashcard.refresh_from_db()
+        assert flashcard.ai_review_state == Flashcard.PENDING
@@ -3,11 +3,12 @@
 import logging
 
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import Http404
 from django.http import HttpResponse
-from django.shortcuts import get_object_or_404
 from django.views import View
 
 from flashcards.core.models import Flashcard
+from flashcards.core.pagination import invalidate_flashcard_list
 
 logger = logging.getLogger(__name__)
 
@@ -32,17 +33,22 @@ class FlashcardDeleteView(LoginRequiredMixin, View):
 
         Returns:
             HttpResponse: Empty 200 response signaling HTMX to remove element
-        """
-        flashcard = get_object_or_404(
-            Flashcard,
-            pk=pk,
-            user=request.user,
-        )
 
+        Raises:
+            Http404: If the user has no flashcard with this primary key
+        """
+        # A single DELETE filtered by owner; nothing references flashcards
+        # and no deletion signals are connected, so Django doesn't need to
+        # fetch the row first
         try:
-            flashcard.delete()
+            deleted, _ = Flashcard.objects.filter(pk=pk, user=request.user).delete()
         except Exception:
             logger.exception("Failed to delete flashcard %s", pk)
             return HttpResponse(status=500)
 
+        if not deleted:
+            msg = "No Flashcard matches the given query."
+            raise Http404(msg)
+
+        invalidate_flashcard_list(request.user.pk)
         return HttpResponse(status=200)
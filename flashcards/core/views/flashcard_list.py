@@ -1,9 +1,36 @@
 """Django view for displaying paginated list of user's flashcards."""
 
+import hashlib
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+from typing import cast
+
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.core.cache import cache
+from django.core.exceptions import PermissionDenied
+from django.http import HttpRequest
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.cache import patch_cache_control
+from django.utils.cache import patch_vary_headers
+from django.utils.http import quote_etag
+from django.utils.translation import get_language
 from django.views.generic import ListView
+from django_htmx.middleware import HtmxDetails
 
 from flashcards.core.models import Flashcard
+from flashcards.core.pagination import FLASHCARD_LIST_CACHE_TIMEOUT
+from flashcards.core.pagination import CachedPKPaginator
+from flashcards.core.pagination import flashcard_list_cache_key
+
+if TYPE_CHECKING:
+    from django.template.response import TemplateResponse
+
+
+class HtmxHttpRequest(HttpRequest):
+    """Request type with the details set by django-htmx's HtmxMiddleware."""
+
+    htmx: HtmxDetails
 
 
 class FlashcardListView(LoginRequiredMixin, ListView):
@@ -13,20 +40,81 @@ class FlashcardListView(LoginRequiredMixin, ListView):
     - User-specific queryset filtering for security
     - Configurable page size via query parameter (25-50 items)
     - HTMX-aware template selection (full page vs. fragment)
+
+    The IDs of the flashcards are cached per user, see CachedPKPaginator.
+    HTMX fragments are cached too, for as long as the cached IDs are valid,
+    and carry an ETag so that unchanged fragments can be revalidated with a
+    304 response.
     """
 
+    request: HtmxHttpRequest
     model = Flashcard
     template_name = "flashcards/flashcard_list.html"
     context_object_name = "flashcards"
     paginate_by = 25
+    paginator_class = CachedPKPaginator
+    # Paginator built by get() for the HTMX fragment cache key
+    _paginator: CachedPKPaginator | None = None
+
+    def get(self, request, *args, **kwargs):
+        """Serve HTMX list fragments from the cache if the list is unchanged.
+
+        Fragments are identified by their cache key, which also serves as
+        their ETag: clients sending it back in If-None-Match get a 304
+        response without the fragment being looked up or rendered.
+        """
+        if not request.htmx:
+            return super().get(request, *args, **kwargs)
+
+        paginator = self.get_paginator(self.get_queryset(), self.get_paginate_by(None))
+        # Rendering below paginates with the same paginator, so its cached
+        # IDs aren't looked up again
+        self._paginator = paginator
+        cache_key = ":".join(
+            [
+                "flashcards:list_fragment",
+                str(request.user.pk),
+                paginator.cache_version,
+                str(request.GET.get(self.page_kwarg, 1)),
+                str(paginator.per_page),
+                get_language(),
+            ],
+        )
+        etag = quote_etag(hashlib.sha256(cache_key.encode()).hexdigest())
+
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            content = cache.get(cache_key)
+            if content is not None:
+                response = HttpResponse(content)
+            else:
+                response = cast(
+                    "TemplateResponse",
+                    super().get(request, *args, **kwargs),
+                )
+                response.render()
+                if response.status_code != HTTPStatus.OK:
+                    return response
+                cache.set(cache_key, response.content, FLASHCARD_LIST_CACHE_TIMEOUT)
+
+        response["ETag"] = etag
+        # Fragments are per user, must be revalidated, and share their URL
+        # with the full page
+        patch_cache_control(response, private=True, no_cache=True)
+        patch_vary_headers(response, ["HX-Request"])
+        return response
 
     def get_queryset(self):
         """Return only flashcards owned by authenticated user.
 
         Applies application-level row security using the custom manager's
         for_user() method to ensure users can only access their own flashcards.
+        Only the columns rendered by the list template are loaded, as dicts
+        rather than model instances.
         """
-        return Flashcard.objects.for_user(self.request.user).ready()
+        return (
+            Flashcard.objects.for_user(self.request.user).ready().values("id", "front")
+        )
 
     def get_paginate_by(self, queryset):
         """Allow page_size override via query param, clamped to 25-50.
@@ -44,17 +132,43 @@ class FlashcardListView(LoginRequiredMixin, ListView):
         except (ValueError, TypeError):
             return 25
 
+    def get_paginator(
+        self,
+        queryset,
+        per_page,
+        orphans=0,
+        allow_empty_first_page=True,  # noqa: FBT002
+        **kwargs,
+    ):
+        """Return a paginator caching the IDs of the user's flashcards."""
+        if self._paginator is not None:
+            return self._paginator
+
+        user = self.request.user
+        # Already enforced by LoginRequiredMixin, this narrows the user type
+        if not user.is_authenticated:
+            raise PermissionDenied
+        return super().get_paginator(
+            queryset,
+            per_page,
+            orphans,
+            allow_empty_first_page,
+            cache_key=flashcard_list_cache_key(user.pk),
+            **kwargs,
+        )
+
     def get_template_names(self):
         """Return fragment template for HTMX requests, full page otherwise.
 
-        When HTMX makes a request (detected via HX-Request header), returns
-        only the list items fragment for efficient DOM swapping. For normal
-        requests, returns the full page template.
+        When HTMX makes a request (detected by django-htmx's middleware from
+        the HX-Request header), returns only the list items fragment for
+        efficient DOM swapping. For normal requests, returns the full page
+        template.
 
         Returns:
             list: Template name(s) to render
         """
-        if self.request.headers.get("HX-Request"):
+        if self.request.htmx:
             return ["flashcards/_flashcard_list_items.html"]
         return [self.template_name]
 
@@ -70,7 +184,10 @@ class FlashcardListView(LoginRequiredMixin, ListView):
             dict: Template context dictionary
         """
         context = super().get_context_data(**kwargs)
-        context["total_count"] = self.get_queryset().count()
-        context["has_flashcards"] = context["total_count"] > 0
-        context["page_size"] = self.get_paginate_by(None)
+        # Reuse the paginator's (cached) count and the page size it was
+        # built with, rather than querying and parsing them again
+        paginator = context["paginator"]
+        context["total_count"] = paginator.count
+        context["has_flashcards"] = paginator.count > 0
+        context["page_size"] = paginator.per_page
         return context
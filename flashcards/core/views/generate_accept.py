@@ -1,14 +1,21 @@
 """Django view for accepting AI-generated flashcards."""
 
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.db.models import Case
+from django.db.models import F
+from django.db.models import Q
+from django.db.models import Value
+from django.db.models import When
 from django.http import Http404
 from django.http import HttpResponse
 from django.http import HttpResponseForbidden
 from django.http import JsonResponse
+from django.utils import timezone
 from django.views import View
 
 from flashcards.core.models import AIGenerationSession
 from flashcards.core.models import Flashcard
+from flashcards.core.pagination import invalidate_flashcard_list
 
 # Field length validation constants
 MAX_FRONT_LENGTH = 200
@@ -22,7 +29,7 @@ class AcceptFlashcardView(LoginRequiredMixin, View):
     Updates the flashcard's creation_method and ai_review_state.
 
     Security:
-    - Verifies session ownership (session.user == request.user)
+    - Only updates a flashcard of the session owned by request.user
     - Validates flashcard belongs to the session
     - Returns 403 if unauthorized access attempt
     """
@@ -40,95 +47,93 @@ class AcceptFlashcardView(LoginRequiredMixin, View):
 
         Returns:
             HttpResponse: Empty 200 response on success (triggers HTMX swap)
-            JsonResponse: 400 with error message on validation failure
+            JsonResponse: 400 with error message on validation failure, 404
+                if the flashcard isn't pending review in this session
             HttpResponseForbidden: 403 if unauthorized
         """
-        # Get and validate session
-        try:
-            session = AIGenerationSession.objects.get(id=session_id)
-        except AIGenerationSession.DoesNotExist as e:
-            raise Http404("Generation session not found") from e
-
-        # Verify session ownership
-        if session.user != request.user:
-            return HttpResponseForbidden(
-                "You don't have permission to access this generation session.",
-            )
-
         # Get POST data
         flashcard_id = request.POST.get("flashcard_id")
         front = request.POST.get("front", "").strip()
         back = request.POST.get("back", "").strip()
 
-        # Validate and get flashcard
-        error_response = self._validate_and_get_flashcard(
-            session,
-            flashcard_id,
-            front,
-            back,
-            request.user,
-        )
+        # Validate flashcard_id
+        if not flashcard_id:
+            return JsonResponse({"error": "Missing flashcard_id"}, status=400)
+
+        # Validate front and back text
+        error_response = self._validate_text_fields(front, back)
         if error_response:
             return error_response
 
-        flashcard = Flashcard.objects.get(
+        # Accept the flashcard in a single UPDATE. It only matches a pending
+        # flashcard of this session owned by the user, so concurrent reviews
+        # can't both apply, and the session doesn't need to be fetched for
+        # the ownership check. The flashcard counts as edited if the
+        # submitted text differs from the stored text, which is compared
+        # as is: generated text is stored already stripped (FlashcardSchema).
+        was_unedited = Q(front=front, back=back)
+        accepted = Flashcard.objects.filter(
             id=flashcard_id,
-            ai_session=session,
+            ai_session_id=session_id,
             user=request.user,
             ai_review_state=Flashcard.PENDING,
+        ).update(
+            front=front,
+            back=back,
+            creation_method=Case(
+                When(was_unedited, then=Value(Flashcard.AI_FULL)),
+                default=Value(Flashcard.AI_EDITED),
+            ),
+            ai_review_state=Flashcard.ACCEPTED,
+            updated_at=timezone.now(),
         )
+        if not accepted:
+            return self._not_accepted_response(request, session_id)
 
-        # Determine if flashcard was edited by comparing with original
-        original_front = flashcard.front.strip()
-        original_back = flashcard.back.strip()
-        was_edited = (front != original_front) or (back != original_back)
-
-        # Update flashcard
-        flashcard.front = front
-        flashcard.back = back
-        flashcard.creation_method = (
-            Flashcard.AI_EDITED if was_edited else Flashcard.AI_FULL
-        )
-        flashcard.ai_review_state = Flashcard.ACCEPTED
-        flashcard.save(
-            update_fields=[
-                "front",
-                "back",
-                "creation_method",
-                "ai_review_state",
-                "updated_at",
-            ],
+        # Count the review on the session
+        AIGenerationSession.objects.filter(pk=session_id).update(
+            accepted_count=F("accepted_count") + 1,
+            reviewed_count=F("reviewed_count") + 1,
         )
+        # The update doesn't send post_save, which would invalidate the
+        # cached list of the user's ready flashcards
+        invalidate_flashcard_list(request.user.pk)
 
         # Return empty response (HTMX will remove card from DOM)
         return HttpResponse(status=200)
 
-    def _validate_and_get_flashcard(self, session, flashcard_id, front, back, user):
-        """Validate flashcard data and return error response if invalid.
+    def _not_accepted_response(self, request, session_id):
+        """Explain why no flashcard was accepted.
+
+        Only runs when the accepting UPDATE matched nothing, to tell a
+        missing or foreign session apart from a flashcard that isn't
+        pending review.
 
         Returns:
-            JsonResponse or None: Error response if validation fails, None otherwise
+            HttpResponseForbidden or JsonResponse: 403 if the session belongs
+            to another user, 404 otherwise
+
+        Raises:
+            Http404: If the session doesn't exist
         """
-        # Validate flashcard_id
-        if not flashcard_id:
-            return JsonResponse({"error": "Missing flashcard_id"}, status=400)
+        session_user_id = (
+            AIGenerationSession.objects.filter(pk=session_id)
+            .values_list("user_id", flat=True)
+            .first()
+        )
+        if session_user_id is None:
+            msg = "Generation session not found"
+            raise Http404(msg)
 
-        # Verify flashcard exists and belongs to session
-        try:
-            Flashcard.objects.get(
-                id=flashcard_id,
-                ai_session=session,
-                user=user,
-                ai_review_state=Flashcard.PENDING,
-            )
-        except Flashcard.DoesNotExist:
-            return JsonResponse(
-                {"error": "Flashcard not found or already reviewed"},
-                status=404,
+        if session_user_id != request.user.pk:
+            return HttpResponseForbidden(
+                "You don't have permission to access this generation session.",
             )
 
-        # Validate front and back text
-        return self._validate_text_fields(front, back)
+        return JsonResponse(
+            {"error": "Flashcard not found or already reviewed"},
+            status=404,
+        )
 
     def _validate_text_fields(self, front, back):
         """Validate front and back text fields.
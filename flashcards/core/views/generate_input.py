@@ -6,9 +6,18 @@ from django.shortcuts import redirect
 from django.urls import reverse
 from django.views.generic import FormView
 
+from flashcards.core.models import MAX_INPUT_TEXT_LENGTH
 from flashcards.core.services.flashcard_generation import FlashcardGenerationService
 from flashcards.core.services.flashcard_generation import GenerateFlashcardsCommand
 
+# Shared by all requests in the process (see FlashcardGenerationService)
+_SERVICE = FlashcardGenerationService()
+
+# Largest form body a valid submission can produce: every character
+# percent-encoded as four UTF-8 bytes ("%XX" each), plus room for the CSRF
+# token and field names. Enforced by RequestBodySizeMiddleware.
+MAX_REQUEST_BODY_SIZE = MAX_INPUT_TEXT_LENGTH * 12 + 1024
+
 
 class GenerateFlashcardsForm(forms.Form):
     """Form for flashcard generation input.
@@ -23,10 +32,10 @@ class GenerateFlashcardsForm(forms.Form):
                 "class": "form-control",
                 "rows": 15,
                 "placeholder": "Paste your study material here (up to 10,000 characters)...",
-                "maxlength": 10000,
+                "maxlength": MAX_INPUT_TEXT_LENGTH,
             },
         ),
-        max_length=10000,
+        max_length=MAX_INPUT_TEXT_LENGTH,
         required=True,
         help_text="Paste text from your notes, textbook, or any study material. The AI will generate 5-10 flashcards from it.",
         error_messages={
@@ -49,6 +58,7 @@ class GenerateFlashcardsInputView(LoginRequiredMixin, FormView):
 
     template_name = "flashcards/generate_input.html"
     form_class = GenerateFlashcardsForm
+    max_request_body_size = MAX_REQUEST_BODY_SIZE
 
     def form_valid(self, form):
         """Handle successful form submission.
@@ -66,13 +76,12 @@ class GenerateFlashcardsInputView(LoginRequiredMixin, FormView):
         input_text = form.cleaned_data["input_text"]
 
         # Generate flashcards using service
-        service = FlashcardGenerationService()
         command = GenerateFlashcardsCommand(
             user=self.request.user,
             input_text=input_text,
         )
 
-        result = service.generate_flashcards(command)
+        result = _SERVICE.generate_flashcards(command)
 
         if result.success:
             # Redirect to review page with session_id
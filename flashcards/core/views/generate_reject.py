@@ -1,10 +1,12 @@
 """Django view for rejecting AI-generated flashcards."""
 
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.db.models import F
 from django.http import Http404
 from django.http import HttpResponse
 from django.http import HttpResponseForbidden
 from django.http import JsonResponse
+from django.utils import timezone
 from django.views import View
 
 from flashcards.core.models import AIGenerationSession
@@ -12,64 +14,101 @@ from flashcards.core.models import Flashcard
 
 
 class RejectFlashcardView(LoginRequiredMixin, View):
-    """View for rejecting an AI-generated flashcard.
+    """View for rejecting AI-generated flashcards.
 
-    Handles POST requests to reject a flashcard.
-    Updates the flashcard's ai_review_state to REJECTED.
+    Handles POST requests to reject a flashcard, or several at once for
+    "reject all". Updates the flashcards' ai_review_state to REJECTED.
 
     Security:
-    - Verifies session ownership (session.user == request.user)
+    - Only updates a flashcard of the session owned by request.user
     - Validates flashcard belongs to the session
     - Returns 403 if unauthorized access attempt
     """
 
+    http_method_names = ["post"]
+
     def post(self, request, session_id):
-        """Reject a flashcard and update its state.
+        """Reject one or more flashcards and update their state.
 
         Expected POST data:
-        - flashcard_id: ID of the flashcard to reject
+        - flashcard_id: ID of the flashcard to reject, or
+        - flashcard_ids: IDs of several flashcards to reject at once
 
         Returns:
             HttpResponse: Empty 200 response on success (triggers HTMX swap)
-            JsonResponse: 400/404 with error message on failure
+            JsonResponse: 200 with the rejected count for flashcard_ids,
+            400/404 with error message on failure
             HttpResponseForbidden: 403 if unauthorized
         """
-        # Get and validate session
-        try:
-            session = AIGenerationSession.objects.get(id=session_id)
-        except AIGenerationSession.DoesNotExist as e:
-            raise Http404("Generation session not found") from e
-
-        # Verify session ownership
-        if session.user != request.user:
-            return HttpResponseForbidden(
-                "You don't have permission to access this generation session.",
-            )
-
         # Get POST data
-        flashcard_id = request.POST.get("flashcard_id")
-
-        # Validate flashcard_id
-        if not flashcard_id:
-            return JsonResponse({"error": "Missing flashcard_id"}, status=400)
+        flashcard_ids = request.POST.getlist("flashcard_ids")
+        is_batch = bool(flashcard_ids)
+        if not is_batch:
+            flashcard_id = request.POST.get("flashcard_id")
+            # Validate flashcard_id
+            if not flashcard_id:
+                return JsonResponse({"error": "Missing flashcard_id"}, status=400)
+            flashcard_ids = [flashcard_id]
 
-        # Get flashcard and verify it belongs to this session
         try:
-            flashcard = Flashcard.objects.get(
-                id=flashcard_id,
-                ai_session=session,
-                user=request.user,
-                ai_review_state=Flashcard.PENDING,
-            )
-        except Flashcard.DoesNotExist:
-            return JsonResponse(
-                {"error": "Flashcard not found or already reviewed"},
-                status=404,
-            )
+            flashcard_ids = [int(flashcard_id) for flashcard_id in flashcard_ids]
+        except ValueError:
+            return JsonResponse({"error": "Invalid flashcard_id"}, status=400)
+
+        # Reject the flashcards in a single UPDATE. It only matches pending
+        # flashcards of this session, so concurrent reviews can't both apply.
+        rejected = Flashcard.objects.filter(
+            id__in=flashcard_ids,
+            ai_session_id=session_id,
+            user=request.user,
+            ai_review_state=Flashcard.PENDING,
+        ).update(
+            ai_review_state=Flashcard.REJECTED,
+            updated_at=timezone.now(),
+        )
+        if not rejected:
+            return self._not_rejected_response(request, session_id)
+
+        # Count the reviews on the session
+        AIGenerationSession.objects.filter(pk=session_id).update(
+            reviewed_count=F("reviewed_count") + rejected,
+        )
 
-        # Update flashcard to rejected state
-        flashcard.ai_review_state = Flashcard.REJECTED
-        flashcard.save(update_fields=["ai_review_state", "updated_at"])
+        if is_batch:
+            return JsonResponse({"rejected_count": rejected})
 
         # Return empty response (HTMX will remove card from DOM)
         return HttpResponse(status=200)
+
+    def _not_rejected_response(self, request, session_id):
+        """Explain why no flashcard was rejected.
+
+        Only runs when the rejecting UPDATE matched nothing, to tell a
+        missing or foreign session apart from a flashcard that isn't
+        pending review.
+
+        Returns:
+            HttpResponseForbidden or JsonResponse: 403 if the session belongs
+            to another user, 404 otherwise
+
+        Raises:
+            Http404: If the session doesn't exist
+        """
+        session_user_id = (
+            AIGenerationSession.objects.filter(pk=session_id)
+            .values_list("user_id", flat=True)
+            .first()
+        )
+        if session_user_id is None:
+            msg = "Generation session not found"
+            raise Http404(msg)
+
+        if session_user_id != request.user.pk:
+            return HttpResponseForbidden(
+                "You don't have permission to access this generation session.",
+            )
+
+        return JsonResponse(
+            {"error": "Flashcard not found or already reviewed"},
+            status=404,
+        )
@@ -1,7 +1,7 @@
 """Django view for flashcard generation review page."""
 
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.http import HttpResponseForbidden
+from django.core.exceptions import PermissionDenied
 from django.views.generic import DetailView
 
 from flashcards.core.models import AIGenerationSession
@@ -32,15 +32,14 @@ class GenerateFlashcardsReviewView(LoginRequiredMixin, DetailView):
 
         Raises:
             Http404: If session doesn't exist
-            HttpResponseForbidden: If session doesn't belong to request user
+            PermissionDenied: If session doesn't belong to request user
         """
         session = super().get_object(queryset)
 
-        # Verify session ownership
-        if session.user != self.request.user:
-            return HttpResponseForbidden(
-                "You don't have permission to access this generation session.",
-            )
+        # Verify session ownership, by ID so the user isn't loaded again
+        if session.user_id != self.request.user.pk:
+            msg = "You don't have permission to access this generation session."
+            raise PermissionDenied(msg)
 
         return session
 
@@ -52,13 +51,17 @@ class GenerateFlashcardsReviewView(LoginRequiredMixin, DetailView):
         """
         context = super().get_context_data(**kwargs)
 
-        # Get all pending flashcards for this session
-        pending_flashcards = Flashcard.objects.filter(
-            ai_session=self.object,
-            ai_review_state=Flashcard.PENDING,
-        ).order_by("id")
+        # Get all pending flashcards for this session. The template renders
+        # all of them, so they are loaded once and counted in Python rather
+        # than with a separate COUNT(*) query.
+        pending_flashcards = list(
+            Flashcard.objects.filter(
+                ai_session=self.object,
+                ai_review_state=Flashcard.PENDING,
+            ).order_by("id"),
+        )
 
         context["flashcards"] = pending_flashcards
-        context["flashcard_count"] = pending_flashcards.count()
+        context["flashcard_count"] = len(pending_flashcards)
 
         return context